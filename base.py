@@ -3,13 +3,22 @@ Base API for SportMonks.
 API information: https://www.sportmonks.com/products/soccer
  """
 import os
+import copy
+import hashlib
+import zlib
+import asyncio
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 import time
 from typing import Dict, Optional, Union, List, Any
-import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pytz
 from errors import (
     BadRequest,
@@ -23,13 +32,215 @@ from errors import (
 )
 import helper
 
-log = helper.setup_logger(__name__, "SM_API.log")
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+try:
+    # urllib3 decodes brotli responses when one of these is installed.
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip, deflate"
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    import json
+    _loads = json.loads
+    _dumps = lambda obj: json.dumps(obj).encode()
+
+log = helper.setup_logger(__name__, "SM_API.log", level=logging.INFO)
+
+# above this many pages, fetch with aiohttp (if installed) instead of threads.
+ASYNC_PAGE_THRESHOLD = 32
+
+# per-endpoint expiry (seconds, -1 never expires) for the optional response
+# cache; anything not matched uses the session's default expire_after.
+CACHE_EXPIRE_AFTER = {
+    "*/continents*": -1,
+    "*/countries*": -1,
+    "*/leagues*": 86400,
+    "*/seasons*": 86400,
+    "*/fixtures/*": 300,
+}
+
+_STATUS_EXC = {
+    400: (BadRequest, "Bad Request Error"),
+    401: (UnathourizedRequest, "Invalid API Key"),
+    403: (APIPermissionError, "Permission error"),
+    404: (APINotFound, "There is no content"),
+    429: (TooManyRequests, "You have reached your request limit"),
+    500: (ServerErrors, "Server errors"),
+    502: (ServerErrors, "Server errors"),
+    503: (ServerErrors, "Server errors"),
+    504: (ServerErrors, "Server errors"),
+}
+
+# requests per second all the clients in the process are paced to, to stay
+# under the plan's rate limit rather than retrying 429s. Off (0) unless set
+# here or with set_rate_limit, so concurrent fetches aren't held back by default.
+RATE_LIMIT = float(os.environ.get("SPORTMONKS_RATE_LIMIT", 0))
+
+
+class _TokenBucket(object):
+    """
+    Thread-safe token bucket, refilled at rate tokens per second
+    and holding at most rate tokens, so bursts are capped at one second's worth.
+    """
+
+    __slots__ = ("rate", "tokens", "updated", "lock")
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Takes a token; returns the seconds to wait before it may be used."""
+        if not self.rate:
+            return 0.0
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def acquire(self):
+        """Blocks until a request may be made."""
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+    def drain(self):
+        """Empties the bucket, e.g. when the API says no requests are left."""
+        with self.lock:
+            self.tokens = min(self.tokens, 0.0)
+
+
+_bucket = _TokenBucket(RATE_LIMIT)
+if RATE_LIMIT:
+    log.info("Pacing requests to %s per second.", RATE_LIMIT)
+
+
+def set_rate_limit(rate: float):
+    """
+    Sets the requests per second all the clients in the process are paced to.
+    Args:
+        rate:
+            requests per second; 0 turns the pacing off.
+    """
+    with _bucket.lock:
+        _bucket.rate = _bucket.tokens = rate
+        _bucket.updated = time.monotonic()
+    if rate:
+        log.info("Pacing requests to %s per second.", rate)
+    else:
+        log.info("Request pacing is off.")
+
+
+def _note_rate_limit(r, *args, **kwargs):
+    """Response hook; stops bursting once the API reports no requests remaining."""
+    if r.headers.get("X-RateLimit-Remaining") == "0":
+        log.info("Rate limit reached for: %s", r.url)
+        _bucket.drain()
+    return r
+
+
+# requests currently being made, keyed on url + params;
+# key -> [Future of the data, number of callers waiting on it].
+_inflight: Dict[tuple, list] = {}
+_inflight_lock = threading.Lock()
+
+# process-wide cache of encoded responses for endpoints with a cache ttl;
+# key -> (expiry time, JSON bytes, ETag, Last-Modified). Expired entries
+# are kept (until evicted) to revalidate with a conditional request.
+MEMORY_CACHE_SIZE = 1024
+_memory_cache: Dict[str, tuple] = {}
+_memory_cache_lock = threading.Lock()
+
+
+def _remember(key: str, raw: bytes, ttl: int, etag: Optional[str] = None,
+              last_modified: Optional[str] = None):
+    """Adds a response to the in-memory cache, evicting the oldest if full."""
+    entry = (time.monotonic() + ttl, raw, etag, last_modified)
+    with _memory_cache_lock:
+        _memory_cache.pop(key, None)
+        while len(_memory_cache) >= MEMORY_CACHE_SIZE:
+            _memory_cache.pop(next(iter(_memory_cache)))
+        _memory_cache[key] = entry
+
+
+def _setup_session(session: requests.Session):
+    """
+    Mounts the pooled, retrying adapter and sets the static headers on a session.
+    """
+    # reuse keep-alive connections across requests and pages, and retry
+    # transient 429/5xx responses with backoff. raise_on_status=False hands
+    # the last response back so it still maps to the API exceptions.
+    retry = Retry(total=5, backoff_factor=0.5,
+                  status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=("GET",), respect_retry_after_header=True,
+                  raise_on_status=False)
+    session.mount("https://", HTTPAdapter(max_retries=retry, pool_connections=4,
+                                          pool_maxsize=32))
+    session.headers.update({"Content-Type": "application/json",
+                            "Accept": "application/json",
+                            "Accept-Encoding": _ACCEPT_ENCODING})
+    session.hooks["response"].append(_note_rate_limit)
+    return session
+
+
+@lru_cache(maxsize=1)
+def _shared_session():
+    """
+    One session for every client in the process, so all the endpoint
+    classes share the same keep-alive connections (and TLS sessions).
+    """
+    return _setup_session(requests.Session())
+
+
+def _aio_params(params: dict):
+    """aiohttp only takes str/int query values; requests drops None values."""
+    return {k: v if isinstance(v, (str, int)) else str(v)
+            for k, v in params.items() if v is not None}
+
+
+@lru_cache(maxsize=128)
+def _url_for(url: str, endpoint: tuple):
+    """Joins the endpoint parts on to the base url."""
+    return url + "/".join(map(str, endpoint))
+
 
 class BaseAPI(object):
     """Base API for SportMonks"""
 
+    # seconds make_request caches responses for (in memory, and on disk
+    # if a cache_dir is set); None doesn't cache.
+    cache_ttl: Optional[int] = None
+
     def __init__(self, api_key: str = None, timeout: Optional[int] = None,
-                 tz: Optional[str] = None):
+                 tz: Optional[str] = None, per_page: Optional[int] = None,
+                 cache_name: Optional[str] = None, cache_dir: Optional[str] = None):
 
         """
         Args:
@@ -39,11 +250,38 @@ class BaseAPI(object):
                 number of seconds to wait before a response from API.
             tz:
                 timezone
+            per_page:
+                number of results per page for paginated endpoints.
+                Defaults to 50.
+            cache_name:
+                if given, responses are cached in a SQLite database of this
+                name (requires requests-cache).
+            cache_dir:
+                directory of an on-disk cache of decoded responses, kept for
+                cache_ttl seconds (requires diskcache). If not given, the
+                environment variable "SPORTMONKS_CACHE_DIR" is used if set.
         """
 
         self.url = "https://soccer.sportmonks.com/api/v2.0/"
         self.api_key = api_key
         self.timeout = timeout
+        self.per_page = per_page or 50
+
+        cache_dir = cache_dir or os.environ.get("SPORTMONKS_CACHE_DIR")
+        if cache_dir and diskcache is None:
+            log.warning("diskcache is not installed, responses will not be cached.")
+        self._cache = diskcache.Cache(cache_dir) if cache_dir and diskcache else None
+
+        if cache_name and CachedSession is not None:
+            self.session = _setup_session(
+                CachedSession(cache_name, backend="sqlite", expire_after=3600,
+                              urls_expire_after=CACHE_EXPIRE_AFTER,
+                              allowable_methods=("GET",), cache_control=True,
+                              stale_if_error=True))
+        else:
+            if cache_name:
+                log.warning("requests-cache is not installed, responses will not be cached.")
+            self.session = _shared_session()
 
         if tz:
             self.tz = tz
@@ -54,11 +292,6 @@ class BaseAPI(object):
         self.initial_params = {"api_token": self.api_key, "tz": self.tz}
         self.meta_info()
 
-        if tz:
-            self.tz = tz
-        else:
-            self.tz = datetime.now().astimezone().tzinfo
-
     def get_key(self):
         """
         If no api_key is specified, then look in environment variables
@@ -75,11 +308,13 @@ class BaseAPI(object):
     def meta_info(self):
         """Returns meta info from your SportMonks plan."""
 
-        r = requests.get(self.create_api_url(endpoint="continents"),
-                         params=self.initial_params)
+        _bucket.acquire()
+        r = self.session.get(self.create_api_url(endpoint="continents"),
+                             params=self.initial_params)
         if r.status_code == 200:
-            r = r.json()
-            log.info("r: %s", r)
+            r = _loads(r.content)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("r: %s", r)
             plan = r.get("meta").get("plan")
 
             if plan:
@@ -92,14 +327,6 @@ class BaseAPI(object):
 
         return None
 
-    @property
-    def headers(self):
-        """Headers"""
-        return {"Content-Type": "application/json",
-                "Accept": "application/json",
-                "Accept-Encoding": "deflate, gzip",
-                "Date": f"{datetime.now()}"}
-
     def __unnest_includes(self, dictionary: dict):
         """
             Changes the SportMonks API response to get rid of the
@@ -132,34 +359,40 @@ class BaseAPI(object):
 
         }
     """
-        unnested = dict()
+        # decoded JSON only holds plain dicts and lists, so `type(...) is`
+        # is enough; the dict is rewritten in place rather than copied.
+        for key, value in dictionary.items():
+            if type(value) is not dict:
+                continue
 
-        for key in dictionary:
-            if isinstance(dictionary[key], dict) and list(dictionary[key].keys()) == ["data"]:
-                data = dictionary[key]["data"]
+            if len(value) == 1 and "data" in value:
+                data = value["data"]
 
-                if isinstance(data, list):
-                    for i, v in enumerate(data):
-                        if isinstance(v, dict):
-                            data[i] = self.__unnest_includes(v)
-                elif isinstance(data, dict):
-                    data = self.__unnest_includes(data)
+                if type(data) is list:
+                    for v in data:
+                        if type(v) is dict:
+                            self.__unnest_includes(v)
+                elif type(data) is dict:
+                    self.__unnest_includes(data)
 
-                unnested[key] = data
+                dictionary[key] = data
 
             else:
-                unnested[key] = dictionary[key]
+                self.__unnest_includes(value)
 
-        return unnested
+        return dictionary
 
-    def create_api_url(self, endpoint: Union[str, int, List[Union[str, int]]]):
+    def create_api_url(self, endpoint: Union[str, int, tuple, List[Union[str, int]]]):
         """
         Creates API URL for different endpoints.
         Excludes paramaters which are passed in to request.get().
         """
-        endpoint = [endpoint] if isinstance(endpoint, (str, int)) else endpoint
+        if isinstance(endpoint, str):
+            return self.url + endpoint
+
+        endpoint = (endpoint,) if isinstance(endpoint, int) else tuple(endpoint)
 
-        return self.url + "/".join(list(map(str, endpoint)))
+        return _url_for(self.url, endpoint)
 
     @staticmethod
     def process_includes(includes: Union[str, List[str]]):
@@ -167,86 +400,304 @@ class BaseAPI(object):
         includes must be in the form of a string,
         with the include separated by a comma.
         """
-        includes = [includes] if isinstance(includes, str) else includes
+        if includes is None or isinstance(includes, str):
+            return includes
         return ",".join(includes)
 
     @staticmethod
     def process_params(params: dict):
         """
-        Processes the paramaters ready to be put in to the query string.
+        Processes the paramaters ready to be put in to the query string;
+        None values are dropped and lists joined in to CSV strings.
         """
-        for key in params.keys():
-            if isinstance(params[key], list):
-                params[key] = ",".join(list(map(str, params[key])))
+        for key, value in list(params.items()):
+            if value is None:
+                del params[key]
+            elif isinstance(value, (list, tuple)):
+                params[key] = ",".join(map(str, value))
 
         return params
 
-    def make_request(self, endpoint: Union[str, List[str]],
-                     includes: Optional[List[str]] = None,
-                     params: Optional[dict] = None,
-                     filters: Optional[dict] = None):
+    def _fetch_pages(self, url: str, page_params: List[dict]):
+        """
+        Fetches the remaining pages of a paginated response concurrently.
 
-        """Make a GET reqeust to SportMonks API"""
+        Uses aiohttp when it is installed and there are more than
+        ASYNC_PAGE_THRESHOLD pages, otherwise a thread pool over the session.
 
+        Returns:
+            A list of (status code, decoded response) in page order.
+        """
+        if aiohttp is not None and len(page_params) > ASYNC_PAGE_THRESHOLD:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self._fetch_pages_async(url, page_params))
+            log.debug("Event loop already running, fetching pages with threads.")
+
+        def fetch(pp):
+            _bucket.acquire()
+            r = self.session.get(url, params=pp, timeout=self.timeout)
+            log.debug("URL: %s", r.url)
+            return r.status_code, _loads(r.content)
+
+        with ThreadPoolExecutor(max_workers=min(8, len(page_params))) as ex:
+            # map yields in submission order, which keeps pages in order.
+            return list(ex.map(fetch, page_params))
+
+    async def _fetch_pages_async(self, url: str, page_params: List[dict],
+                                 max_concurrency: int = 32):
+        """Fetches pages with aiohttp, at most max_concurrency at a time."""
+
+        sem = asyncio.Semaphore(max_concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        async def fetch(s, pp):
+            async with sem:
+                await asyncio.sleep(_bucket.reserve())
+                async with s.get(url, params=_aio_params(pp)) as r:
+                    log.debug("URL: %s", r.url)
+                    _note_rate_limit(r)
+                    return r.status, _loads(await r.read())
+
+        connector = aiohttp.TCPConnector(limit=max_concurrency)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers=dict(self.session.headers)) as s:
+            return await asyncio.gather(*[fetch(s, pp) for pp in page_params])
 
-        if params:
-            params = self.process_params(params)
-            params.update(self.initial_params)
-        else:
-            params = self.initial_params
+    @staticmethod
+    def _raise_for_error(status_code: int, response: dict):
+        """
+        Raises the exception matching the status code if the response
+        contains an error.
+        """
+        if "error" not in response:
+            return
+
+        error_message = response["error"].get("message")
+        log.error("Error: %s", error_message)
 
-        if filters:
-            filters = self.process_params(filters)
-            params.update(filters)
+        exc = _STATUS_EXC.get(status_code)
+        if exc:
+            exc_type, reason = exc
+            raise exc_type(f"{reason}, reason: {error_message}")
+
+    @staticmethod
+    def clear_reference_cache():
+        """Empties the in-memory response cache shared by all clients."""
+        with _memory_cache_lock:
+            _memory_cache.clear()
+
+    def _build_params(self, includes: Optional[List[str]] = None,
+                      params: Optional[dict] = None,
+                      filters: Optional[dict] = None):
+        """Query string params for a request, starting at page 1."""
+
+        # build a fresh dict so nothing leaks in to self.initial_params or
+        # the caller's params between requests.
+        params = {**(self.process_params(dict(params)) if params else {}),
+                  **self.initial_params,
+                  **(self.process_params(dict(filters)) if filters else {})}
 
         if includes:
-            includes = self.process_includes(includes)
-            params["include"] = includes
+            params["include"] = self.process_includes(includes)
 
-        if "page" not in params:
-            params["page"] = 1
+        params.setdefault("page", 1)
+        params.setdefault("per_page", self.per_page)
 
+        return params
+
+    def _unnest_data(self, data: Union[dict, List[dict]]):
+        """Unnests the includes of the response data, in place."""
+
+        if isinstance(data, dict):
+            self.__unnest_includes(data)
+        elif isinstance(data, list):
+            for d in data:
+                self.__unnest_includes(d)
+        else:
+            raise TypeError(f"Did not expect response of type: {type(data)}")
+
+        return data
+
+    def iter_pages(self, endpoint: Union[str, List[str]],
+                   includes: Optional[List[str]] = None,
+                   params: Optional[dict] = None,
+                   filters: Optional[dict] = None):
+        """
+        Like make_request, but yields the data one page at a time,
+        so only one page of a large response is held in memory.
+        Pages are fetched as they are consumed.
+        """
+        params = self._build_params(includes, params, filters)
+        log.info("Params: %s", params)
+        url = self.create_api_url(endpoint=endpoint)
+
+        page, total_pages = params["page"], params["page"]
+        while page <= total_pages:
+            try:
+                _bucket.acquire()
+                r = self.session.get(url, params={**params, "page": page},
+                                     timeout=self.timeout)
+                log.debug("URL: %s", r.url)
+            except requests.exceptions.Timeout as e:
+                log.info("Response has timed out: %s", e)
+                raise SystemExit(e)
+
+            try:
+                response = _loads(r.content)
+            except ValueError as e:
+                log.info("Could not decode response in to JSON: %s", e)
+                raise SystemExit(e)
+
+            self._raise_for_error(r.status_code, response)
+
+            pagination = (response.get("meta") or {}).get("pagination")
+            if pagination:
+                total_pages = pagination.get("total_pages") or total_pages
+
+            data = response.get("data")
+            if data:
+                yield self._unnest_data(data)
+            page += 1
+
+    def make_request(self, endpoint: Union[str, List[str]],
+                     includes: Optional[List[str]] = None,
+                     params: Optional[dict] = None,
+                     filters: Optional[dict] = None,
+                     no_cache: bool = False, ttl: Optional[int] = None):
+
+        """
+        Make a GET reqeust to SportMonks API
+
+        Responses are cached in memory, and on disk if set up, for ttl seconds,
+        defaulting to the class's cache_ttl. no_cache skips the cache.
+        Expired responses are revalidated with a conditional request.
+        """
+
+        params = self._build_params(includes, params, filters)
         log.info("Params: %s", params)
 
 
         url = self.create_api_url(endpoint=endpoint)
 
+        ttl = self.cache_ttl if ttl is None else ttl
+        use_cache = bool(ttl) and not no_cache
+        stale, disk_key = None, None
+        if use_cache:
+            disk_key, cached, stale = self._cached(url, params, ttl)
+            if cached is not None:
+                return cached
+
+        cache_key = (url, tuple(sorted(params.items(), key=lambda kv: kv[0])))
+
+        # identical requests already in flight (e.g. from other threads) share
+        # the one response rather than each going to the API.
+        with _inflight_lock:
+            flight = _inflight.get(cache_key)
+            leader = flight is None
+            if leader:
+                flight = _inflight[cache_key] = [Future(), 0]
+            else:
+                flight[1] += 1
+
+        if not leader:
+            log.debug("Waiting on the same request in flight: %s", url)
+            return copy.deepcopy(flight[0].result())
+
+        try:
+            data = self._fetch(url, params, stale, disk_key, use_cache, ttl)
+        except BaseException as e:
+            flight[0].set_exception(e)
+            raise
+        else:
+            flight[0].set_result(data)
+        finally:
+            with _inflight_lock:
+                _inflight.pop(cache_key, None)
+                waiters = flight[1]
+
+        # the waiters copy data as well, so the caller mustn't mutate it.
+        return copy.deepcopy(data) if waiters else data
+
+    def _cached(self, url: str, params: dict, ttl: int):
+        """
+        Looks a request up in the in-memory, then the on-disk, cache.
+        Returns:
+            (cache key, the cached data or None, the expired in-memory entry or None).
+        """
+        disk_key = hashlib.blake2b(repr((url, sorted(params.items(), key=lambda kv: kv[0])))
+                                   .encode(), digest_size=16).hexdigest()
+        # decoding the stored bytes hands every caller its own copy.
+        with _memory_cache_lock:
+            hit = _memory_cache.get(disk_key)
+        stale = None
+        if hit is not None:
+            if hit[0] > time.monotonic():
+                log.debug("Using cached response for: %s", url)
+                return disk_key, _loads(hit[1]), None
+            stale = hit
+
+        blob = self._cache.get(disk_key) if self._cache is not None else None
+        if blob is not None:
+            log.info("Using cached response for: %s", url)
+            raw = zlib.decompress(blob)
+            _remember(disk_key, raw, ttl)
+            return disk_key, _loads(raw), None
+
+        return disk_key, None, stale
+
+    def _store(self, disk_key: str, data: Union[dict, List[dict]], ttl: int,
+               etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Caches a response in memory, and on disk if set up, for ttl seconds."""
+        raw = _dumps(data)
+        _remember(disk_key, raw, ttl, etag, last_modified)
+        if self._cache is not None:
+            self._cache.set(disk_key, zlib.compress(raw), expire=ttl)
+
+    def _fetch(self, url: str, params: dict, stale: Optional[tuple],
+               disk_key: Optional[str], use_cache: bool, ttl: Optional[int]):
+        """
+        The network half of make_request: GETs the url (conditionally, if
+        there's a stale cached copy), fetches any remaining pages and
+        caches the result.
+        """
+        # revalidate an expired cached response rather than downloading it again.
+        headers = {}
+        if stale is not None:
+            if stale[2]:
+                headers["If-None-Match"] = stale[2]
+            if stale[3]:
+                headers["If-Modified-Since"] = stale[3]
+
         try:
-            r = requests.get(url, params=params, headers=self.headers,
-                             timeout=self.timeout)
+            _bucket.acquire()
+            r = self.session.get(url, params=params, timeout=self.timeout,
+                                 headers=headers or None)
             log.info("URL: %s", r.url)
         except requests.exceptions.Timeout as e:
             log.info("Response has timed out: %s", e)
             raise SystemExit(e)
             # recursion here?
 
+        if headers and r.status_code == 304:
+            log.info("Not modified, using cached response for: %s", r.url)
+            _remember(disk_key, stale[1], ttl, stale[2], stale[3])
+            return _loads(stale[1])
+
         try:
-            response = r.json()
-            log.info("r: %s", response)
+            response = _loads(r.content)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("r: %s", response)
 
+        # orjson.JSONDecodeError is a subclass of ValueError.
         except ValueError as e:
             log.info("Could not decode response in to JSON: %s", e)
             raise SystemExit(e)
 
         log.info("status code: %s", r.status_code)
 
-        if "error" in response:
-            error_message = response["error"].get("message")
-            log.error("Error: %s", error_message)
-
-            if r.status_code == 400:
-                raise BadRequest(f"Bad Request Error, reason: {error_message}")
-            elif r.status_code == 401:
-                raise UnathourizedRequest(f"Invalid API Key, reason: {error_message}")
-            elif r.status_code == 403:
-                raise APIPermissionError(f"Permission error, reason: {error_message}")
-            elif r.status_code == 404:
-                raise APINotFound(f"There is no content, reason: {error_message}")
-            elif r.status_code == 429:
-                raise TooManyRequests(f"You have reached your request limit, reason: \
-                                      {error_message}")
-            elif r.status_code in [500, 502, 503, 504]:
-                raise ServerErrors(f"Server errors, reason: {error_message}")
+        self._raise_for_error(r.status_code, response)
 
         data = response.get("data")
         if not data:
@@ -254,58 +705,48 @@ class BaseAPI(object):
             raise SystemExit("No data available. No fixtures in that time-frame.")
 
 
+        total_pages = 1
         if ("meta" in response) and ("pagination" in response.get("meta")):
             total_pages = response["meta"]["pagination"].get("total_pages")
             log.info("Response is paginated; %s pages", total_pages)
-            for page in range(2, total_pages + 1):
-                params["page"] = page
-                r = requests.get(url, params=params, headers=self.headers,
-                                 timeout=self.timeout)
-                log.info("URL: %s", r.url)
-                next_page_data = r.json().get("data")
-                if next_page_data:
-                    data += next_page_data
-
-        if isinstance(data, dict):
-            data = self.__unnest_includes(data)
-        elif isinstance(data, list):
-            data = [self.__unnest_includes(d) for d in data]
-        else:
-            raise TypeError(f"Did not expect response of type: {type(data)}")
+            if total_pages > 1:
+                page_params = [{**params, "page": page}
+                               for page in range(2, total_pages + 1)]
+                pages = [data]
+                for status_code, page_response in self._fetch_pages(url, page_params):
+                    self._raise_for_error(status_code, page_response)
+                    next_page_data = page_response.get("data")
+                    if next_page_data:
+                        pages.append(next_page_data)
+                data = list(chain.from_iterable(pages))
+
+        self._unnest_data(data)
+
+        if use_cache:
+            # a 304 on page 1 says nothing about the other pages, so only
+            # single-page responses are kept for conditional requests.
+            etag = last_modified = None
+            if total_pages <= 1:
+                etag = r.headers.get("ETag")
+                last_modified = r.headers.get("Last-Modified")
+            self._store(disk_key, data, ttl, etag, last_modified)
 
         return data
 
-    @classmethod
-    def __is_normalizable(cls, response: dict):
-        """
-        Is the response JSON normalizable?
-        json_normalize only handels nested dictionaries,
-        if the values in the dicts are lists then they won't be unnested.
-        """
-
-        for key in response:
-            if isinstance(response[key], list):
-                log.debug("This key has a list value: %s", key)
-                return False
-            elif isinstance(response[key], dict):
-                cls.__is_normalizable(response[key])
-
-        return True
-
-
     def _to_df(self, response: Union[dict, List[dict]],
                cols: Optional[Union[str, List[str]]] = None):
 
         """Transforms JSON API reponse to a pandas DataFrame"""
 
-        if isinstance(response, dict):
-            if not self.__is_normalizable(response):
-                raise NotJSONNormalizable("Response is not JSON-normalizable.")
-        elif isinstance(response, list):
-            if not all(self.__is_normalizable(fixt) for fixt in response):
-                raise NotJSONNormalizable("Response is not JSON-normalizable.")
+        # top-level columns only: build the frame directly, missing keys are NaN.
+        if isinstance(cols, list) and not any("." in col for col in cols):
+            records = [response] if isinstance(response, dict) else response
+            return pd.DataFrame.from_records(records, columns=cols)
 
-        df = pd.json_normalize(response)
+        try:
+            df = pd.json_normalize(response)
+        except (TypeError, ValueError, AttributeError) as e:
+            raise NotJSONNormalizable("Response is not JSON-normalizable.") from e
 
         if cols:
             try:
@@ -314,8 +755,147 @@ class BaseAPI(object):
                 log.info("No key, value pair for column: %s", e)
                 missing_keys = set(cols).difference(df.columns)
                 log.info("Missing keys: %s", missing_keys)
-                for key in missing_keys:
-                    df[key] = np.NaN
-                df = df[cols]
+                # reindex fills the missing columns with NaN.
+                df = df.reindex(columns=cols)
 
         return df
+
+    def _df_or_json(self, response: Union[dict, List[dict]], df: bool = False,
+                    cols: Optional[Union[str, List[str]]] = None):
+        """
+        The response as a DataFrame if df is True, otherwise (or if it
+        can't be normalized) the JSON response.
+        """
+        if not df:
+            return response
+        try:
+            return self._to_df(response, cols=cols)
+        except NotJSONNormalizable:
+            log.info("Not JSON-normalizable, returning JSON instead.")
+            return response
+
+
+class AsyncBaseAPI(BaseAPI):
+    """
+    BaseAPI with coroutine requests over one shared aiohttp session, so
+    independent requests can overlap with asyncio.gather. Requires aiohttp.
+
+    Use as an async context manager, or call close() when done.
+    """
+
+    def __init__(self, api_key: str = None, timeout: Optional[int] = None,
+                 tz: Optional[str] = None, per_page: Optional[int] = None,
+                 max_connections: int = 32):
+
+        """
+        Args:
+            max_connections:
+                maximum number of open connections to the API.
+            See BaseAPI for the other arguments.
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncBaseAPI requires aiohttp; pip install aiohttp")
+
+        super().__init__(api_key=api_key, timeout=timeout, tz=tz, per_page=per_page)
+        self.max_connections = max_connections
+        self._aio_session = None
+
+    @classmethod
+    def from_client(cls, client: BaseAPI, max_connections: int = 32):
+        """
+        An instance sharing an existing client's key, timezone, session
+        headers, caches and cache_ttl, without requesting the plan info again.
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncBaseAPI requires aiohttp; pip install aiohttp")
+
+        self = cls.__new__(cls)
+        for attr in ("url", "api_key", "timeout", "per_page", "tz", "initial_params",
+                     "session", "_cache", "cache_ttl"):
+            setattr(self, attr, getattr(client, attr))
+        self.max_connections = max_connections
+        self._aio_session = None
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        """Closes the aiohttp session."""
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
+
+    def _client(self):
+        # created lazily, as a ClientSession must be made inside the event loop.
+        if self._aio_session is None or self._aio_session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=8,
+                                             ttl_dns_cache=300)
+            self._aio_session = aiohttp.ClientSession(
+                connector=connector, headers=dict(self.session.headers),
+                timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self._aio_session
+
+    async def _get(self, url: str, params: dict):
+        """GET request; returns the status code and decoded response."""
+        await asyncio.sleep(_bucket.reserve())
+        async with self._client().get(url, params=_aio_params(params)) as r:
+            log.debug("URL: %s", r.url)
+            _note_rate_limit(r)
+            return r.status, _loads(await r.read())
+
+    async def make_request_async(self, endpoint: Union[str, List[str]],
+                                 includes: Optional[List[str]] = None,
+                                 params: Optional[dict] = None,
+                                 filters: Optional[dict] = None,
+                                 no_cache: bool = False, ttl: Optional[int] = None):
+
+        """
+        Coroutine version of make_request. Uses the same response cache,
+        but doesn't revalidate expired responses.
+        """
+
+        params = self._build_params(includes, params, filters)
+        log.info("Params: %s", params)
+        url = self.create_api_url(endpoint=endpoint)
+
+        ttl = self.cache_ttl if ttl is None else ttl
+        disk_key = None
+        if ttl and not no_cache:
+            disk_key, cached, _ = self._cached(url, params, ttl)
+            if cached is not None:
+                return cached
+
+        status_code, response = await self._get(url, params)
+        self._raise_for_error(status_code, response)
+
+        data = response.get("data")
+        if not data:
+            log.error("No data was included!")
+            raise SystemExit("No data available. No fixtures in that time-frame.")
+
+        pagination = (response.get("meta") or {}).get("pagination")
+        total_pages = pagination.get("total_pages") if pagination else 1
+        if total_pages and total_pages > 1:
+            pages = await asyncio.gather(*[self._get(url, {**params, "page": page})
+                                           for page in range(2, total_pages + 1)])
+            all_pages = [data]
+            for status_code, page_response in pages:
+                self._raise_for_error(status_code, page_response)
+                if page_response.get("data"):
+                    all_pages.append(page_response["data"])
+            data = list(chain.from_iterable(all_pages))
+
+        data = self._unnest_data(data)
+        if disk_key is not None:
+            self._store(disk_key, data, ttl)
+
+        return data
+
+    @staticmethod
+    async def gather(*coros):
+        """Runs the requests concurrently; results are in the order given."""
+        return await asyncio.gather(*coros)
@@ -3,9 +3,11 @@ Run every night to insert the new information from fixtures that day
 in to PostgreSQL database.
 """
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import db_cols
-from to_database import fixtures_data_to_sql, to_psql, ENGINE
+import base
+from to_database import fixtures_data_frames, write_fixtures_data, to_psql, get_engine
 from football import Continents, Countries, Bookmakers, Markets, Leagues, Seasons
 
 start_time = time.time()
@@ -13,38 +15,47 @@ today = datetime.today().strftime('%Y-%m-%d')
 
 if __name__ == "__main__":
 
-    with ENGINE.begin() as con:
-
-        to_psql(Continents().continents(), table="Continents", engine=con,
-                if_exists="replace", cols=["id", "name"])
-
-        to_psql(Countries().countries(), table="Countries", engine=con,
-                if_exists="replace", cols=["id", "name"])
-
-        to_psql(Bookmakers().bookmakers(), table="Bookmakers", engine=con,
-                if_exists="replace", cols=["id", "name"])
+    # pace the API calls to stay under the plan's limit,
+    # unless SPORTMONKS_RATE_LIMIT already sets a rate.
+    base.set_rate_limit(base.RATE_LIMIT or 3)
+    ENGINE = get_engine()
 
-        to_psql(Markets().markets(), table="Markets", engine=con,
-                if_exists="replace", cols=["id", "name"])
+    # (table, API call, columns) for the metadata tables.
+    metadata = [("Continents", lambda: Continents().continents(), ["id", "name"]),
+                ("Countries", lambda: Countries().countries(), ["id", "name"]),
+                ("Bookmakers", lambda: Bookmakers().bookmakers(), ["id", "name"]),
+                ("Markets", lambda: Markets().markets(), ["id", "name"]),
+                ("Leagues", lambda: Leagues().by_id(), ["id", "name"]),
+                ("Seasons", lambda: Seasons().seasons(), ["id", "name", "league_id"])]
 
-        to_psql(Leagues().by_id(), table="Leagues", engine=con,
-                if_exists="replace", cols=["id", "name"])
+    # fetch everything before opening the transaction, so it isn't held
+    # open while waiting on the API; each table is then COPYed in.
+    with ThreadPoolExecutor(max_workers=len(metadata)) as pool:
+        responses = list(pool.map(lambda meta: meta[1](), metadata))
 
-        to_psql(Seasons().seasons(), table="Seasons", engine=con,
-                if_exists="replace", cols=["id", "name", "league_id"])
-
-
-    for league in db_cols.LEAGUES:
-
-        fixtures_data_to_sql(today, today, league_ids=db_cols.LEAGUES[league],
-                             table=league, if_exists="append", engine=ENGINE,
-                             markets=[1, 12, 976105, 976334,
-                                      976316, 136703818, 136830811],
-                             bookmakers=[2, 9, 15, 187, 27802, 271057011, 271057013],
-                             includes="league.country,localTeam,visitorTeam,\
-                                       localCoach,visitorCoach,\
-                                       venue,referee,stats,lineup,odds",
-                             cols=db_cols.FIXTURE_COLUMNS,
-                             cols_rename=db_cols.RENAME_FIXT_COLUMNS)
+    with ENGINE.begin() as con:
+        for (table, _, cols), response in zip(metadata, responses):
+            to_psql(response, table=table, engine=con, if_exists="replace", cols=cols)
+
+
+    def fetch_league(league):
+        return fixtures_data_frames(today, today, league_ids=db_cols.LEAGUES[league],
+                                    table=league,
+                                    markets=[1, 12, 976105, 976334,
+                                             976316, 136703818, 136830811],
+                                    bookmakers=[2, 9, 15, 187, 27802, 271057011, 271057013],
+                                    includes="league.country,localTeam,visitorTeam,\
+                                              localCoach,visitorCoach,\
+                                              venue,referee,stats,lineup,odds",
+                                    cols=db_cols.FIXTURE_COLUMNS,
+                                    cols_rename=db_cols.RENAME_FIXT_COLUMNS)
+
+    # the API calls for each league are fetched concurrently,
+    # then everything is written in one go; leagues with no
+    # fixtures today come back as None and are skipped.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        leagues = list(pool.map(fetch_league, db_cols.LEAGUES))
+
+    write_fixtures_data(leagues, engine=ENGINE, if_exists="append")
 
 print(f"---Time elapsed: {time.time() - start_time} seconds---")
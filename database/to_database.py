@@ -3,18 +3,23 @@ Feeds relevant information in to PostgreSQL database.
 """
 
 import os
+import re
 import sys
 import logging
 import warnings
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from typing import Dict, Optional, Union, List, Any
-import copy
-import numpy as np
+from io import StringIO
 import pandas as pd
 import psycopg2
 import sqlalchemy
 from sqlalchemy import create_engine
 from sqlalchemy import inspect
-from fuzzywuzzy import process
+from sqlalchemy.engine import URL
+from rapidfuzz import fuzz, process, utils
 import football
 from football import Fixtures
 import helper
@@ -23,6 +28,16 @@ import db_cols
 log = helper.setup_logger(__name__, "SM_API.log", level=logging.ERROR)
 sql_log = helper.setup_logger("sqlalchemy", r".\database\sqlalchemy.engine")
 POSTGRES_PASSWORD = os.environ.get("POSTGRES_PASSWORD")
+PG_MAX_PARAMS = 65535
+_LABEL_RE = re.compile(r"\b(Home|Draw|Away)\b")
+# Home/Draw/Away, "|" and whitespace in one pass; whitespace maps to "".
+_LABEL_SEP_RE = re.compile(r"\b(?:Home|Draw|Away)\b|\||\s")
+_LABEL_MAP = {"Home": "1", "Draw": "X", "Away": "2", "|": "/"}
+_YES_NO = frozenset(("Yes", "No"))
+_OVER_UNDER = frozenset(("Over", "Under"))
+_1X2 = frozenset(("1", "X", "2"))
+PG_TYPES = {"object": "TEXT", "int64": "BIGINT", "float64": "DOUBLE PRECISION",
+            "bool": "BOOLEAN", "datetime64[ns]": "TIMESTAMP"}
 
 def postgres_engine(driver: str, username: str, password: str,
                     host: str, port: int, database: str):
@@ -46,16 +61,237 @@ def postgres_engine(driver: str, username: str, password: str,
         Engine object.
     """
 
-    return create_engine(f"postgresql+{driver}://{username}:{password} \
-                         @{host}:{port}/{database}")
+    url = URL.create(f"postgresql+{driver}", username=username, password=password,
+                     host=host, port=port, database=database)
 
-ENGINE = postgres_engine("psycopg2", "postgres", POSTGRES_PASSWORD,
-                         "localhost", 5432, "SportMonks")
-INSPECTOR = inspect(ENGINE)
+    # LIFO keeps reusing the most recently returned (warm) connection;
+    # recycle before the server or a proxy drops idle ones.
+    return create_engine(url, pool_size=5, max_overflow=10, pool_pre_ping=True,
+                         pool_use_lifo=True, pool_recycle=3600,
+                         executemany_mode="values_plus_batch",
+                         executemany_values_page_size=1000,
+                         executemany_batch_page_size=500)
+
+@lru_cache(maxsize=1)
+def get_engine():
+    """
+    The engine for the SportMonks database, created on first use
+    so importing this module doesn't set up a connection pool.
+    """
+    return postgres_engine("psycopg2", "postgres", POSTGRES_PASSWORD,
+                           "localhost", 5432, "SportMonks")
+
+def get_inspector():
+    """Inspector for the SportMonks database."""
+    return inspect(get_engine())
+
+def _flatten(record: dict, sep: str = ".", prefix: str = "", out: Optional[dict] = None):
+    """
+    Flattens nested dicts in to one level, joining the keys with sep.
+    Lists are left as they are, as with pd.json_normalize.
+    """
+    out = {} if out is None else out
+    for key, value in record.items():
+        if isinstance(value, dict):
+            _flatten(value, sep, f"{prefix}{key}{sep}", out)
+        else:
+            out[f"{prefix}{key}"] = value
+
+    return out
+
+def _normalize(response: Union[Dict, List[Dict]]):
+    """DataFrame with one row per (flattened) record of the response."""
+    records = response if isinstance(response, list) else [response]
+
+    # already flat records don't need walking.
+    if not any(isinstance(value, dict) for record in records for value in record.values()):
+        return pd.DataFrame.from_records(records)
+
+    return pd.DataFrame([_flatten(record) for record in records])
+
+def _nullable_ints(df: pd.DataFrame):
+    """
+    df with float columns that only hold whole numbers (int columns with
+    missing values, e.g. attendance) as nullable Int64, so they're written
+    as 12000 rather than 12000.0, which a BIGINT column won't accept.
+    """
+    converted = {}
+    for col in df.select_dtypes(include="float").columns:
+        values = df[col].dropna()
+        # all-null columns are left as floats; inf % 1 is NaN, so it's left too.
+        if not values.empty and (values % 1 == 0).all():
+            converted[col] = df[col].astype("Int64")
+
+    return df.assign(**converted) if converted else df
+
+def _copy_from_df(df: pd.DataFrame, table: str, con, if_exists: str = "append"):
+    """
+    Streams a DataFrame in to a PostgreSQL table using COPY FROM STDIN.
+    The table is created from the DataFrame's schema if it doesn't exist.
+    Args:
+        df:
+            DataFrame to write.
+        table:
+            Name of the table.
+        con:
+            sqlalchemy.engine.base.Engine or Connection type; connection to database.
+        if_exists:
+            What to do if the table already exists,
+            must be "fail", "replace" or "append".
+    Returns:
+        None
+    """
+    if isinstance(con, sqlalchemy.engine.Engine):
+        with con.begin() as connection:
+            return _copy_from_df(df, table, connection, if_exists=if_exists)
+
+    # appending in to an existing table needs no DDL, so skip pandas' to_sql.
+    if if_exists != "append" or not _has_table(table, con):
+        df.head(0).to_sql(table, con=con, index=False, if_exists=if_exists)
+        _forget_table(table, con)
+
+    buf = StringIO()
+    _nullable_ints(df).to_csv(buf, index=False, header=False, na_rep="\\N")
+    buf.seek(0)
+
+    columns = ", ".join(f"\"{col}\"" for col in df.columns)
+    sql = f"COPY public.\"{table}\" ({columns}) FROM STDIN WITH (FORMAT CSV, NULL '\\N')"
+    raw = con.connection.cursor()
+    try:
+        raw.copy_expert(sql, buf)
+    except psycopg2.Error as e:
+        # surface COPY errors the same way to_sql does.
+        raise sqlalchemy.exc.DBAPIError(sql, None, e) from e
+    finally:
+        raw.close()
+
+    return None
+
+def _write_df(df: pd.DataFrame, table: str, con, if_exists: str,
+              method: str = "copy", chunksize: int = 1000):
+    """
+    Writes a DataFrame with COPY, or with multi-row INSERTs where COPY isn't
+    appropriate (e.g. appending in to a table with triggers/generated columns).
+    """
+    if isinstance(con, sqlalchemy.engine.Engine):
+        with con.begin() as connection:
+            return _write_df(df, table, connection, if_exists,
+                             method=method, chunksize=chunksize)
+
+    # savepoint, so a failed write can be recovered from
+    # without aborting the caller's transaction.
+    try:
+        with con.begin_nested():
+            if method == "copy":
+                _copy_from_df(df, table, con, if_exists=if_exists)
+            elif method == "insert":
+                if if_exists != "append" or not _has_table(table, con):
+                    df.head(0).to_sql(table, con=con, index=False, if_exists=if_exists)
+                    _forget_table(table, con)
+                records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+                _bulk_insert(records, table, con)
+            else:
+                # keep each INSERT under PostgreSQL's bind parameter limit.
+                chunksize = min(chunksize, PG_MAX_PARAMS // max(len(df.columns), 1))
+                df.to_sql(table, con=con, index=False, if_exists=if_exists,
+                          method="multi", chunksize=chunksize)
+                _forget_table(table, con)
+    except Exception:
+        # any DDL in the savepoint was rolled back with it.
+        _forget_table(table, con)
+        raise
+
+    return None
+
+def _reflected_tables(con):
+    """
+    Tables reflected on con, by name. Kept in the connection's info,
+    so they're reused for as long as the pooled connection lives.
+    """
+    return con.info.setdefault("sportmonks_tables", {})
+
+def _reflect(table: str, con):
+    """The table's sqlalchemy.Table, reflected on first use."""
+    tables = _reflected_tables(con)
+    tbl = tables.get(table)
+    if tbl is None:
+        tbl = tables[table] = sqlalchemy.Table(table, sqlalchemy.MetaData(),
+                                               autoload_with=con)
+    return tbl
+
+def _forget_table(table: str, con):
+    """Drops the reflected table, after it's been created, replaced or altered."""
+    _reflected_tables(con).pop(table, None)
+
+def _has_table(table: str, con):
+    """Whether the table exists; tables already reflected on con need no query."""
+    return table in _reflected_tables(con) or inspect(con).has_table(table, schema="public")
+
+def _bulk_insert(records: List[Dict], table: str, con):
+    """
+    Inserts records with a single executemany of the table's INSERT statement,
+    skipping pandas' per-call table introspection.
+    Columns not yet in the table are added first.
+    """
+    if isinstance(con, sqlalchemy.engine.Engine):
+        with con.begin() as connection:
+            return _bulk_insert(records, table, connection)
+
+    if not records:
+        return None
+
+    tbl = _reflect(table, con)
+    if set(records[0]).difference(tbl.columns.keys()):
+        _add_missing_columns(pd.DataFrame(records[:1]), table, con)
+        tbl = _reflect(table, con)
+
+    con.execute(tbl.insert(), records)
+
+    return None
+
+def _add_missing_columns(df: pd.DataFrame, table: str, con):
+    """
+    Adds the DataFrame's columns that aren't in the table yet,
+    typed from the DataFrame's dtypes.
+    Returns:
+        The columns that were added.
+    """
+    if isinstance(con, sqlalchemy.engine.Engine):
+        with con.begin() as connection:
+            return _add_missing_columns(df, table, connection)
+
+    # zero-row query; only the column names cross the wire.
+    existing = set(con.execute(f"SELECT * FROM public.\"{table}\" LIMIT 0").keys())
+    missing = [col for col in df.columns if col not in existing]
+    for col in missing:
+        pg_type = PG_TYPES.get(df[col].dtype.name, "TEXT")
+        # IF NOT EXISTS, so a column added concurrently by another writer is fine.
+        con.execute(f"ALTER TABLE public.\"{table}\" ADD COLUMN IF NOT EXISTS \"{col}\" {pg_type}")
+    log.info("Added columns to %s: %s", table, missing)
+    _forget_table(table, con)
+
+    return missing
+
+def _handle_missing_column(e: sqlalchemy.exc.DBAPIError, df: pd.DataFrame, table: str,
+                           con, method: str = "copy", chunksize: int = 1000):
+    """
+    Recovers from a write that failed because the table is missing columns
+    (pgcode 42703) by adding them and appending the rows again.
+    Any other error is re-raised.
+    """
+    if e.orig.pgcode != '42703':
+        print(f"Error: {e.orig.diag.message_primary}")
+        raise e
+
+    print(f"Column exception: {e.orig.diag.message_primary}")
+    _add_missing_columns(df, table, con)
+    _write_df(df, table, con, if_exists="append", method=method, chunksize=chunksize)
+
+    return None
 
 def to_psql(response: Union[Dict, List[Dict], pd.DataFrame], table: str, engine,
             if_exists: str = "fail", cols: Optional[List[str]] = None,
-            chunksize: int = 100000):
+            chunksize: int = 1000, method: str = "copy"):
     """
     Stores data from SportMonks API in a PostgreSQL database.
     Args:
@@ -70,9 +306,14 @@ def to_psql(response: Union[Dict, List[Dict], pd.DataFrame], table: str, engine,
             must be "fail", "replace" or "append".
         cols: optional
             What columns you want in your table.
-        chunksize: default = 100000
-            Specify the number of rows in each batch to be written at a time.
-            By default, all rows will be written at once.
+        chunksize: default = 1000
+            Specify the number of rows in each INSERT when method = "multi".
+            Capped so a single INSERT stays under PostgreSQL's parameter limit.
+        method: default = "copy"
+            How to write the rows, must be "copy", "multi" or "insert".
+            "multi" uses multi-row INSERTs; use it where COPY isn't appropriate.
+            "insert" executes the table's INSERT for all rows at once, so the
+            values are bound against the existing table's column types.
     Returns:
         None
     """
@@ -80,73 +321,44 @@ def to_psql(response: Union[Dict, List[Dict], pd.DataFrame], table: str, engine,
     log.info("Creating Table: %s", table)
     assert if_exists in ("fail", "replace", "append"), \
         "if exists must be; \"fail\", \"replace\" or \"append\""
+    assert method in ("copy", "multi", "insert"), \
+        "method must be; \"copy\", \"multi\" or \"insert\""
 
-    if isinstance(response, pd.DataFrame):
-        if cols:
-            try:
-                response[cols].to_sql(table, con=engine, index=False,
-                                      if_exists=if_exists, chunksize=chunksize)
-            except KeyError as e:
-                raise KeyError(f"The column is not in the API response: {e}")
-            except sqlalchemy.exc.DBAPIError as e:
-                if e.orig.pgcode == '42703':
-                    print(f"Column exception: {e.orig.diag.message_primary}")
-                    data = pd.read_sql(f"SELECT * FROM public.\"{table}\"", con=engine)
-                    new_response = pd.concat([data, response[cols]])
-                    new_response.to_sql(table, con=engine, index=False,
-                                        if_exists="replace", chunksize=chunksize)
-                else:
-                    print(f"Error: {e.orig.diag.message_primary}")
-                    raise
-        else:
-            try:
-                response.to_sql(table, con=engine, index=False,
-                                if_exists=if_exists, chunksize=chunksize)
-            except sqlalchemy.exc.DBAPIError as e:
-                if e.orig.pgcode == '42703':
-                    print(f"Column exception: {e.orig.diag.message_primary}")
-                    data = pd.read_sql(f"SELECT * FROM public.\"{table}\"", con=engine)
-                    new_response = pd.concat([data, response])
-                    new_response.to_sql(table, con=engine, index=False,
-                                        if_exists="replace", chunksize=chunksize)
-                else:
-                    print(f"Error: {e.orig.diag.message_primary}")
-                    raise
-    else:
-        if cols:
-            try:
-                pd.json_normalize(response)[cols].to_sql\
-                (table, con=engine, index=False,
-                 if_exists=if_exists, chunksize=chunksize)
-            except KeyError as e:
-                raise KeyError(f"The column is not in the API response: {e}")
-            except sqlalchemy.exc.DBAPIError as e:
-                print(f"Column exception: {e.orig.diag.message_primary}")
-                if e.orig.pgcode == '42703':
-                    data = pd.read_sql(f"SELECT * FROM public.\"{table}\"", con=engine)
-                    new_response = pd.concat([data, pd.json_normalize(response)[cols]])
-                    new_response.to_sql(table, con=engine, index=False,
-                                        if_exists="replace", chunksize=chunksize)
-                else:
-                    print(f"Error: {e.orig.diag.message_primary}")
-                    raise
-        else:
-            try:
-                pd.json_normalize(response).to_sql(table, con=engine,
-                                                   index=False, if_exists=if_exists,
-                                                   chunksize=chunksize)
-            except sqlalchemy.exc.DBAPIError as e:
-                if e.orig.pgcode == '42703':
-                    print(f"Column exception: {e.orig.diag.message_primary}")
-                    data = pd.read_sql(f"SELECT * FROM public.\"{table}\"", con=engine)
-                    new_response = pd.concat([data, pd.json_normalize(response)])
-                    new_response.to_sql(table, con=engine, index=False,
-                                        if_exists="replace", chunksize=chunksize)
-                else:
-                    print(f"Error: {e.orig.diag.message_primary}")
-                    raise
-
-    log.info("%s", INSPECTOR.get_table_names())
+    df = response if isinstance(response, pd.DataFrame) else _normalize(response)
+    if cols:
+        try:
+            df = df[cols]
+        except KeyError as e:
+            raise KeyError(f"The column is not in the API response: {e}")
+
+    try:
+        _write_df(df, table, engine, if_exists=if_exists,
+                  method=method, chunksize=chunksize)
+    except sqlalchemy.exc.DBAPIError as e:
+        _handle_missing_column(e, df, table, engine, method=method, chunksize=chunksize)
+
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("%s", get_inspector().get_table_names())
+
+    return None
+
+def _write_tables_parallel(tables: List[tuple], engine,
+                           method: str = "copy", max_workers: int = 8):
+    """
+    Writes independent (table name, rows, if_exists) triples concurrently.
+    Each table gets its own connection and transaction from the engine's pool.
+    """
+    def write(table):
+        name, rows, if_exists = table
+        with engine.begin() as con:
+            to_psql(response=rows, table=name, engine=con,
+                    if_exists=if_exists, method=method)
+
+    if not tables:
+        return None
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tables))) as pool:
+        list(pool.map(write, tables))
 
     return None
 
@@ -163,58 +375,40 @@ def stats_includes(response: Union[Dict, List[Dict]]):
         Transformed response, ready for use of json_normalize
     """
 
-    if isinstance(response, list):
-        for fixt in response:
-            statistics = fixt.get("stats")
-            if len(statistics) == 2:
-                fixt["home"] = statistics[0]
-                fixt["away"] = statistics[1]
-                del fixt["stats"]
-            else:
-                log.info("Length of statistics: %s", len(statistics))
-                fixt["home"] = {}
-                fixt["away"] = {}
-                del fixt["stats"]
+    log_missing = log.isEnabledFor(logging.INFO)
 
-    elif isinstance(response, dict):
-        statistics = response.get("stats")
+    for fixt in (response if isinstance(response, list) else [response]):
+        statistics = fixt.pop("stats", None) or []
         if len(statistics) == 2:
-            response["home"] = statistics[0]
-            response["away"] = statistics[1]
-            del response["stats"]
+            fixt["home"], fixt["away"] = statistics[0], statistics[1]
         else:
-            log.info("Length of statistics: %s", len(statistics))
-            response["home"] = {}
-            response["away"] = {}
-            del response["stats"]
+            if log_missing:
+                log.info("Length of statistics: %s", len(statistics))
+            fixt["home"], fixt["away"] = {}, {}
 
     return response
 
-def odds_includes(response: Union[Dict, List[Dict]], markets: Union[int, List[int]],
-                  table: str, if_exists: str, engine):
+def odds_includes(response: Union[Dict, List[Dict]],
+                  markets: Optional[Union[int, List[int]]], table: str):
     """
-    For each fixture, populates SQL table(s) with odds information
-    from the fixtures endpoint.
+    For each fixture, collects the odds information from the fixtures endpoint
+    in to one set of rows per market table.
     ***Must use the odds includes.
     Args:
         response:
             Response from SportMonks API; JSON format.
         markets:
             The markets you want to create tables for.
+            If None, a table is created for every market in the response.
         table:
-            Name of SQL table.
-        if_exists:
-            What to do if the table already exists,
-            must be "fail", "replace" or "append".
-        engine:
-            sqlalchemy.engine.base.Engine type; connection to database.
+            Name of SQL table; market tables are named table_market.
     Returns:
-        None
+        List of (table name, rows) pairs, one per market with odds.
     """
     markets = [markets] if isinstance(markets, int) else markets
-    odds_list = [[] for _ in range(len(markets))]
-    for p, i in enumerate(markets):
-        odds_list[p].append(i)
+    # with no markets given, bucket every market that comes back.
+    buckets: Dict[int, List[Dict]] = {int(m): [] for m in markets} if markets \
+        else defaultdict(list)
 
     to_process = response if isinstance(response, list) else [response]
 
@@ -223,65 +417,156 @@ def odds_includes(response: Union[Dict, List[Dict]], markets: Union[int, List[in
             log.info("No odds included")
             continue
         odds = fixt.get("odds")
+        home = (fixt.get("localTeam") or {}).get("name")
+        away = (fixt.get("visitorTeam") or {}).get("name")
         log.info("Number of markets: %s", len(odds))
 
+        fixture_id = fixt.get("id")
+
         for market in odds:
-            fixture_odds_dict = {"id": fixt.get("id")}
-            fixture_odds_dict["market_id"] = market.get("id")
-            fixture_odds_dict["market"] = market.get("name")
+            market_id = market.get("id")
+            fixture_odds_dict = {"id": fixture_id, "market_id": market_id,
+                                 "market": market.get("name")}
             bookmaker = market.get("bookmaker")
 
             for i in bookmaker:
                 log.info("Number of bookmakers: %s", len(bookmaker))
                 actual_odds = i.get("odds")
                 log.info("Actual odds: %s", len(actual_odds))
-                home = fixt.get("localTeam").get("name")
-                away = fixt.get("visitorTeam").get("name")
                 actual_odds = standardise_columns(actual_odds, home, away)
-                if market.get("id") == 976105:
+                if market_id == 976105:
                     labels = [j.get("label") for j in actual_odds]
-                    if any(n not in ["Yes", "No"] for n in labels):
+                    if not all(n in _YES_NO for n in labels):
                         log.error("Incorrect label for BTTS: %s", labels)
                         continue
 
+                prefix = i.get("name") + "_"
                 for j in actual_odds:
-                    if market.get("id") == 12:
-                        if j.get("label") not in ["Over", "Under"]:
-                            log.info("Incorrect Over/Under label: %s",
-                                     j.get("label"))
-                            continue
-                    if market.get("id") == 976316:
-                        if all(x not in j.get("label") for x in ["Yes", "No"]) or \
-                           all(x not in j.get("label") for x in ["1", "X", "2"]):
-                            log.debug("Incorrect label for Result/BTTS: %s",
-                                      j.get("label"))
-                            continue
-
-                    if j.get("total") is not None:
-                        if ("." in j.get("total")) and (j.get("total").split(".")[1] == "5"):
-                            fixture_odds_dict[
-                                i.get("name")+"_"+j.get("label")+str(j.get("total"))
-                                ] = j.get("value")
-                    else:
-                        fixture_odds_dict[
-                            i.get("name")+"_"+j.get("label")
-                            ] = j.get("value")
-
-            for z in odds_list:
-                if z[0] == fixture_odds_dict["market_id"] and len(fixture_odds_dict) != 3:
-                    z.append(fixture_odds_dict)
-
-
-    for i in odds_list:
-        del i[0]
-        if len(i) != 0:
-            market = i[0].get("market").replace(" ", "_")
-            to_psql(response=i, table=table+"_"+market,
-                    engine=engine, if_exists=if_exists)
+                    label = j.get("label")
+                    if not _valid_label(market_id, label):
+                        continue
+
+                    total = j.get("total")
+                    if not _keep_total(total):
+                        continue
+                    fixture_odds_dict[prefix+label+(total or "")] = j.get("value")
+
+            if len(fixture_odds_dict) != 3:
+                bucket = buckets.get(market_id) if markets else buckets[market_id]
+                if bucket is not None:
+                    bucket.append(fixture_odds_dict)
+
+
+    odds_tables = []
+    for market_id, rows in buckets.items():
+        if rows:
+            market = rows[0].get("market").replace(" ", "_")
+            odds_tables.append((table+"_"+market, rows))
         else:
-            log.info("No odds were included")
+            log.info("No odds were included for market: %s", market_id)
 
-    return None
+    return odds_tables
+
+def _valid_label(market_id: int, label: str):
+    """
+    Whether a (standardised) label is valid for the Over/Under
+    and Result/BTTS markets. Labels of other markets are always valid.
+    """
+    if market_id == 12:
+        if label not in _OVER_UNDER:
+            log.info("Incorrect Over/Under label: %s", label)
+            return False
+    elif market_id == 976316:
+        parts = [part.strip() for part in label.split("/")]
+        if len(parts) != 2 or parts[0] not in _1X2 or parts[1] not in _YES_NO:
+            log.debug("Incorrect label for Result/BTTS: %s", label)
+            return False
+
+    return True
+
+def _keep_total(total: Optional[str]):
+    """
+    Whether to keep an odd with this total line; only the .5 lines
+    (e.g. 2.5) are kept, and odds without a line always are.
+    """
+    return total is None or total.partition(".")[2] == "5"
+
+def odds_long(response: Union[Dict, List[Dict]],
+              markets: Optional[Union[int, List[int]]], table: str):
+    """
+    Long format alternative to odds_includes: one row per
+    (fixture, market, bookmaker, label, total) in a single table,
+    instead of one wide table per market with a column per bookmaker and label.
+    The same odds are kept as in odds_includes, so only the .5 total lines.
+    ***Must use the odds includes.
+    Args:
+        response:
+            Response from SportMonks API; JSON format.
+        markets:
+            The markets you want to keep. If None, every market is kept.
+        table:
+            Name of SQL table; the odds table is named table_odds.
+    Returns:
+        List with the single (table name, DataFrame) pair, or an empty list
+        if there were no odds.
+    """
+    markets = {markets} if isinstance(markets, int) else \
+        ({int(m) for m in markets} if markets else None)
+
+    records = []
+    for fixt in (response if isinstance(response, list) else [response]):
+        odds = fixt.get("odds")
+        if not odds:
+            log.info("No odds included")
+            continue
+        fixture_id = fixt.get("id")
+        home = (fixt.get("localTeam") or {}).get("name")
+        away = (fixt.get("visitorTeam") or {}).get("name")
+
+        for market in odds:
+            market_id = market.get("id")
+            if markets is not None and market_id not in markets:
+                continue
+            market_name = market.get("name")
+
+            for i in market.get("bookmaker"):
+                actual_odds = standardise_columns(i.get("odds"), home, away)
+                if market_id == 976105 and \
+                        not all(j.get("label") in _YES_NO for j in actual_odds):
+                    log.error("Incorrect label for BTTS: %s",
+                              [j.get("label") for j in actual_odds])
+                    continue
+
+                bookmaker = i.get("name")
+                for j in actual_odds:
+                    label = j.get("label")
+                    if _valid_label(market_id, label) and _keep_total(j.get("total")):
+                        records.append((fixture_id, market_id, market_name, bookmaker,
+                                        label, j.get("total"), j.get("value")))
+
+    if not records:
+        return []
+
+    df = pd.DataFrame.from_records(records, columns=["fixture_id", "market_id", "market",
+                                                     "bookmaker", "label", "total", "value"])
+
+    return [(table+"_odds", df)]
+
+@lru_cache(maxsize=4096)
+def _closest_team(team: str, home: str, away: str):
+    """
+    Which of home, away or draw ("X") a label's team most closely matches.
+    Exact matches skip the fuzzy match.
+    """
+    if team in (home, away, "X"):
+        return team
+
+    return process.extractOne(team, [home, away, "X"], scorer=fuzz.WRatio,
+                              processor=utils.default_process)[0]
+
+def _label_token(match: re.Match):
+    """Replacement for a Home/Draw/Away, "|" or whitespace match in a label."""
+    return _LABEL_MAP.get(match.group(0), "")
 
 def standardise_columns(response: Union[Dict, List[Dict]],
                         home: str, away: str):
@@ -305,38 +590,26 @@ def standardise_columns(response: Union[Dict, List[Dict]],
     """
     log.error("Home: %s, Away: %s", home, away)
     home_away_draw = {home: "1", "X": "X", away: "2"}
-    choices = [home, away, "X"]
     if isinstance(response, list):
         for x in response:
-            if "Home" in x.get("label"):
-                x["label"] = x.get("label").replace("Home", "1")
-            elif "Draw" in x.get("label"):
-                x["label"] = x.get("label").replace("Draw", "X")
-            elif "Away" in x.get("label"):
-                x["label"] = x.get("label").replace("Away", "2")
-
-        for i in response:
-            if "|" in i.get("label"):
-                label = i.get("label").split("|")[0].strip()
-                log.error("LABEL: %s", label)
-                i["label"] = \
-                i.get("label").replace(label, home_away_draw[process.extractOne(label, choices)[0]])
-                i["label"] = i.get("label").replace("|", "/").replace(" ", "")
-                log.error("Fuzzy: %s", home_away_draw[process.extractOne(label, choices)[0]])
-                log.error("NEW LABEL: %s", i["label"])
+            # Home/Draw/Away become 1/X/2 before the team is split off,
+            # so only real team names go to the fuzzy match.
+            lbl = _LABEL_RE.sub(_label_token, x["label"])
+            if "|" in lbl:
+                team, outcome = lbl.split("|", 1)
+                team = team.strip()
+                log.error("LABEL: %s", team)
+                fuzzy = team if team in _1X2 else home_away_draw[_closest_team(team, home, away)]
+                lbl = _LABEL_SEP_RE.sub(_label_token, fuzzy + "|" + outcome)
+                log.error("Fuzzy: %s", fuzzy)
+                log.error("NEW LABEL: %s", lbl)
+            x["label"] = lbl
 
         return response
 
     elif isinstance(response, dict):
 
-        if "Home" in response.get("label"):
-            response["label"] = response.get("label").replace("Home", "1")
-        elif "Draw" in response.get("label"):
-            response["label"] = response.get("label").replace("Draw", "X")
-        elif "Away" in response.get("label"):
-            response["label"] = response.get("label").replace("Away", "2")
-
-        response["label"] = response.get("label").replace("|", "/").replace(" ", "")
+        response["label"] = _LABEL_SEP_RE.sub(_label_token, response["label"])
         log.info("Final label: %s", response["label"])
 
         return response
@@ -344,10 +617,177 @@ def standardise_columns(response: Union[Dict, List[Dict]],
     else:
         raise TypeError(f"Did not expect response of type: {type(response)}")
 
+def fixtures_data_frames(start_date: str, end_date: str, league_ids: int, table: str,
+                         markets: Union[int, List[int]] = None,
+                         bookmakers: Union[int, List[int]] = None, includes: str = None,
+                         cols: Union[str, List[str]] = None, cols_rename: dict = None,
+                         long_odds: bool = False):
+
+    """
+    Fetches fixture data from the API and prepares it for the database,
+    without writing anything.
+    See fixtures_data_to_sql for the arguments.
+    Returns:
+        (table, frames, odds_tables); frames are the (table name, data) pairs
+        for the fixtures and players tables, odds_tables the pairs for each
+        market's odds table. Pass a list of these to write_fixtures_data.
+        None if there are no fixtures in the date range.
+    """
+    fixt = Fixtures(football.KEY)
+
+    # read by page, as by_date_range treats a day with no fixtures as an error.
+    fixtures = list(chain.from_iterable(
+        fixt.by_date_range_pages(start_date=start_date, end_date=end_date,
+                                 league_ids=league_ids, markets=markets,
+                                 bookmakers=bookmakers, includes=includes)))
+    if not fixtures:
+        log.info("No fixtures for %s between %s and %s", table, start_date, end_date)
+        return None
+
+    return _prepare_fixtures(fixtures, table, markets=markets, includes=includes,
+                             cols=cols, cols_rename=cols_rename, long_odds=long_odds)
+
+def _prepare_fixtures(fixtures: Union[Dict, List[Dict]], table: str,
+                      markets: Union[int, List[int]] = None, includes: str = None,
+                      cols: Union[str, List[str]] = None, cols_rename: dict = None,
+                      long_odds: bool = False):
+    """
+    Splits fixtures from the API in to the fixtures, players and odds data
+    to write; see fixtures_data_frames.
+    """
+    # want to add fixture data before odds and player data
+    # for database integrity purposes (FKs)
+    # lineups and odds are taken off the fixtures, and only written later.
+    if isinstance(fixtures, dict):
+        fixtures = [fixtures]
+    elif not isinstance(fixtures, list):
+        raise TypeError(f"Did not expect object of type: {type(fixtures)}")
+
+    lineups = [fixt.pop("lineup", None) or [] for fixt in fixtures]
+    odds = [fixt.pop("odds", None) for fixt in fixtures]
+
+    response = stats_includes(fixtures)
+    df = _normalize(response)
+
+    if cols:
+        # missing columns are filled with NaN by reindex; the diff is only logged.
+        if log.isEnabledFor(logging.INFO):
+            missing_keys = set(cols).difference(df.columns)
+            if missing_keys:
+                log.info("Missing keys: %s", missing_keys)
+        df = df.reindex(columns=cols)
+
+    df = df.rename(columns=cols_rename or {})
+
+    # fixtures and players are written in one transaction, fixtures first
+    frames = [(table, df)]
+
+    if "lineup" in includes:
+        frames.append((table+"_players", list(chain.from_iterable(lineups))))
+
+    odds_tables = []
+    if "odds" in includes:
+        for fixt, fixt_odds in zip(fixtures, odds):
+            if fixt_odds is not None:
+                fixt["odds"] = fixt_odds
+        odds_fn = odds_long if long_odds else odds_includes
+        odds_tables = odds_fn(fixtures, markets=markets, table=table)
+
+    return table, frames, odds_tables
+
+def _table_if_exists(table: str, if_exists: str, written: Optional[set]):
+    """
+    if_exists for a table; tables already written earlier in the same
+    load (those in written) are appended to. Adds table to written.
+    """
+    if written is None:
+        return if_exists
+    mode = "append" if table in written else if_exists
+    written.add(table)
+    return mode
+
+def write_fixtures_data(leagues: List[tuple], engine, if_exists: str,
+                        con=None, written: Optional[set] = None):
+
+    """
+    Writes the data prepared by fixtures_data_frames for one or more leagues.
+    All fixtures and players tables are written in one transaction,
+    with each fixture's season name looked up from the Seasons table,
+    then the odds tables, which reference the committed fixtures,
+    are written concurrently.
+    Args:
+        leagues:
+            List of (table, frames, odds_tables) from fixtures_data_frames;
+            leagues without fixtures (None) are skipped.
+        engine:
+            sqlalchemy.engine.base.Engine type; connection to database.
+        if_exists:
+            What to do if the table already exists.
+            Must be "fail", "replace" or "append".
+        con: optional
+            Open connection to write everything on, odds tables included,
+            inside the caller's transaction; the odds tables are then
+            written one after another.
+        written: optional
+            Names of the tables already written in this load, which are
+            appended to rather than handled by if_exists. The tables
+            written here are added to it.
+    Returns:
+        None.
+    """
+    leagues = [league for league in leagues if league is not None]
+    if not leagues:
+        return None
+
+    if con is None:
+        with engine.begin() as con:
+            _write_fixtures_frames(leagues, con, if_exists, written)
+
+        # odds tables are independent of each other, so they are written concurrently.
+        odds_tables = [(name, rows, _table_if_exists(name, if_exists, written))
+                       for _, _, league_odds in leagues for name, rows in league_odds]
+        _write_tables_parallel(odds_tables, engine=engine, method="insert")
+        return None
+
+    _write_fixtures_frames(leagues, con, if_exists, written)
+    for _, _, league_odds in leagues:
+        for name, rows in league_odds:
+            to_psql(response=rows, table=name, engine=con,
+                    if_exists=_table_if_exists(name, if_exists, written), method="insert")
+
+    return None
+
+def _write_fixtures_frames(leagues: List[tuple], con, if_exists: str,
+                           written: Optional[set] = None):
+    """
+    Writes the fixtures and players tables of the leagues on con,
+    with each fixture's season name looked up from the Seasons table.
+    """
+    # season names are looked up before the write, rather than
+    # UPDATEing every row of the table afterwards.
+    seasons = dict(con.execute("SELECT id, name FROM public.\"Seasons\"").fetchall())
+
+    for table, frames, _ in leagues:
+        fixtures_df = frames[0][1]
+        if "season_id" in fixtures_df.columns:
+            fixtures_df["season"] = fixtures_df["season_id"].map(seasons)
+
+        for name, frame in frames:
+            to_psql(response=frame, table=name, engine=con,
+                    if_exists=_table_if_exists(name, if_exists, written))
+
+        #con.execute(f"ALTER TABLE public.\"{table}\" ADD PRIMARY KEY (id);")
+        #con.execute(f"ALTER TABLE public.\"{table}\" ALTER COLUMN datetime TYPE \
+                    #timestamp with time zone using \
+                    #to_timestamp(datetime, 'YYYY-MM-DD HH24:MI:SS');")
+
+    return None
+
 def fixtures_data_to_sql(start_date: str, end_date: str, league_ids: int, table: str,
                          engine, if_exists: str, markets: Union[int, List[int]] = None,
                          bookmakers: Union[int, List[int]] = None, includes: str = None,
-                         cols: Union[str, List[str]] = None, cols_rename: dict = None):
+                         cols: Union[str, List[str]] = None, cols_rename: dict = None,
+                         long_odds: bool = False):
 
     """
     Insert relevant fixture data in to SQL database.
@@ -386,79 +826,30 @@ def fixtures_data_to_sql(start_date: str, end_date: str, league_ids: int, table:
             Columns you want in your table.
         cols_rename: optional
             Rename columns.
+        long_odds: default = False
+            Write the odds to one long format table (see odds_long)
+            rather than a wide table per market.
         Returns:
             None.
     """
     fixt = Fixtures(football.KEY)
 
-    fixtures = fixt.by_date_range(start_date=start_date, end_date=end_date,
-                                  league_ids=league_ids, markets=markets,
-                                  bookmakers=bookmakers,
-                                  includes=includes)
-
-    # want to add fixture data before odds and player data
-    # for database integrity purposes (FKs)
-    # & want to limit amount of API calls so just make a copy
-
-    fixt_copy = copy.deepcopy(fixtures)
-    if isinstance(fixt_copy, list):
-        for fixt in fixt_copy:
-            if "lineup" in fixt:
-                del fixt["lineup"]
-            if "odds" in fixt:
-                del fixt["odds"]
-    elif isinstance(fixt_copy, dict):
-        if "lineup" in fixt_copy:
-            del fixt_copy["lineup"]
-        if "odds" in fixtures:
-            del fixt_copy["odds"]
-
-    response = stats_includes(fixt_copy)
-    df = pd.json_normalize(response)
-
-    try:
-        df = df[cols]
-    except KeyError as e:
-        log.debug("Key error for columns: %s", e)
-        missing_keys = set(cols).difference(df.columns)
-        log.info("Missing keys: %s", missing_keys)
-        for key in missing_keys:
-            df[key] = np.NaN
-        df = df[cols]
-    finally:
-        if cols_rename:
-            df.rename(columns=cols_rename, inplace=True)
+    pages = fixt.by_date_range_pages(start_date=start_date, end_date=end_date,
+                                     league_ids=league_ids, markets=markets,
+                                     bookmakers=bookmakers,
+                                     includes=includes)
 
+    # one page is prepared and written at a time, so only one page of
+    # fixtures is held in memory. Every page is written in the one transaction,
+    # so a failed page rolls back the whole load; a table is only created
+    # (with if_exists) by the first page with rows for it, later pages append.
+    written = set()
     with engine.begin() as con:
-        to_psql(response=df, table=table, engine=con,
-                if_exists=if_exists)
-        #con.execute(f"ALTER TABLE public.\"{table}\" ADD PRIMARY KEY (id);")
-        #con.execute(f"ALTER TABLE public.\"{table}\" ALTER COLUMN datetime TYPE \
-                    #timestamp with time zone using \
-                    #to_timestamp(datetime, 'YYYY-MM-DD HH24:MI:SS');")
-        #con.execute(f"ALTER TABLE public.\"{table}\" ADD COLUMN season text")
-        con.execute(f"UPDATE public.\"{table}\"  \
-                     SET season = public.\"Seasons\".name \
-                     FROM public.\"Seasons\" \
-                     WHERE public.\"{table}\".season_id = public.\"Seasons\".id")
-
-        if "lineup" in includes:
-            player_stats = []
-
-            if isinstance(fixtures, list):
-                for fixt in fixtures:
-                    player_stats += [i for i in fixt.get("lineup")]
-            elif isinstance(fixtures, dict):
-                player_stats = fixtures["lineup"]
-            else:
-                raise TypeError(f"Did not expect object of type: {type(fixtures)}")
-
-            to_psql(response=player_stats, table=table+"_players",
-                    engine=con, if_exists=if_exists)
-
-    if "odds" in includes:
-        odds_includes(fixtures, markets=markets, table=table,
-                      if_exists=if_exists, engine=engine)
-
+        for page in pages:
+            league = _prepare_fixtures(page, table, markets=markets, includes=includes,
+                                       cols=cols, cols_rename=cols_rename,
+                                       long_odds=long_odds)
+            write_fixtures_data([league], engine=engine, if_exists=if_exists,
+                                con=con, written=written)
 
     return None
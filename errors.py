@@ -26,3 +26,6 @@ class IncompatibleArgs(Exception):
 
 class NotJSONNormalizable(Exception):
     """Raises an error when the response is not normalizable"""
+
+class InvalidIncludes(Exception):
+    """Raises when an include isn't available for the endpoint."""
@@ -1,20 +1,106 @@
 """SportMonks Football API"""
 
 import os
+import asyncio
 import logging
+import queue
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, timedelta
+from itertools import chain
 from typing import Dict, Optional, Union, List, Any
-import numpy as np
 import pandas as pd
-from base import BaseAPI
+from base import BaseAPI, AsyncBaseAPI
 import helper
-from errors import IncompatibleArgs, NotJSONNormalizable
+from errors import IncompatibleArgs, InvalidIncludes
 
-log = helper.setup_logger(__name__, "SM_API.log")
+log = helper.setup_logger(__name__, "SM_API.log", level=logging.INFO)
 KEY = os.environ.get("SPORTMONKS_KEY")
 
+# standings at a date before today are cached for a week.
+PAST_STANDINGS_TTL = 7 * 24 * 3600
+
+# search results are cached for a day, keyed on the normalised search term.
+SEARCH_TTL = 24 * 3600
+
+# the top level includes of the endpoints; nested ones (e.g.
+# goalscorers.player.country) are left for the API to check.
+TOPSCORERS_INCLUDES = frozenset({"goalscorers", "assistscorers", "cardscorers"})
+AGGREGATED_TOPSCORERS_INCLUDES = frozenset({
+    "aggregatedGoalscorers", "aggregatedAssistscorers", "aggregatedCardscorers"})
+
+def _validate_includes(includes: Optional[Union[str, List[str]]], allowed: frozenset):
+    """
+    includes as a comma separated string, raising InvalidIncludes
+    before any request is made if one's first part isn't in allowed.
+    """
+    if not includes:
+        return None
+    includes = includes.split(",") if isinstance(includes, str) else includes
+    includes = [include.strip() for include in includes]
+    invalid = [include for include in includes if include.split(".")[0] not in allowed]
+    if invalid:
+        raise InvalidIncludes(f"Includes not available for this endpoint: {', '.join(invalid)}")
+    return ",".join(includes)
+
+def _odds_endpoint(fixture_id: int, bookmaker_id: Optional[int] = None,
+                   market_id: Optional[int] = None):
+    """Odds endpoint for a fixture, optionally by bookmaker or market."""
+    if bookmaker_id and market_id:
+        raise IncompatibleArgs("No endpoint for market and bookmaker id. Use \
+                               the filters keyword with market_id or bookmaker_id endpoint.")
+    if bookmaker_id:
+        return f"odds/fixture/{fixture_id}/bookmaker/{bookmaker_id}"
+    if market_id:
+        return f"odds/fixture/{fixture_id}/market/{market_id}"
+    return f"odds/fixture/{fixture_id}"
+
+def _market_row(fixture_id: int, market: List[dict]):
+    """
+    Flattens a fixture's odds for one market in to a single row, with a
+    "<bookmaker>_<label>" column per price; lines are only kept for .5
+    totals, e.g. "bet365_Over2.5".
+    """
+    row = {"id": fixture_id}
+    if not market:
+        return row
+    market = market[0]
+    row["market_id"] = market.get("id")
+    row["market"] = market.get("name")
+
+    for bookmaker in market.get("bookmaker") or ():
+        prefix = bookmaker.get("name") + "_"
+        for odd in bookmaker.get("odds") or ():
+            total = odd.get("total")
+            if total is None:
+                row[prefix + odd.get("label")] = odd.get("value")
+            elif total.partition(".")[2] == "5":
+                row[prefix + odd.get("label") + total] = odd.get("value")
+
+    return row
+
+def _normalise_search(search: str):
+    """"Man Utd", " man utd " and "MAN  UTD" are all the same search."""
+    return " ".join(search.strip().casefold().split())
+
+def _cached_search(api: BaseAPI, endpoint: str, search: str,
+                   includes: Optional[Union[str, List[str]]] = None,
+                   filters: Optional[dict] = None):
+    """
+    Searches an endpoint (leagues/players) with the normalised search term,
+    reusing the result of an identical search made within SEARCH_TTL seconds.
+    """
+    return api.make_request(endpoint=[endpoint, "search", _normalise_search(search)],
+                            includes=includes, filters=filters, ttl=SEARCH_TTL)
+
 class Continents(BaseAPI):
     """Continents Class."""
 
+    # rarely changes, so responses are cached for a week.
+    cache_ttl = 7 * 24 * 3600
+
     def __init__(self, api_key: Optional[str] = None, timeout: Optional[int] = None):
         super().__init__(api_key, timeout)
 
@@ -48,32 +134,18 @@ class Continents(BaseAPI):
             log.info("Get continent by id: %s, with includes = %s", continent_id, includes)
             continents = self.make_request(endpoint=["continents", continent_id],
                                            includes=includes, filters=filters)
-            if df:
-                try:
-                    df_continents = self._to_df(continents, cols=df_cols)
-                    return df_continents
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable, returning JSON instead.")
-                    return continents
-            else:
-                return continents
+            return self._df_or_json(continents, df, df_cols)
         else:
             log.info("Get all continents")
             continents = self.make_request(endpoint="continents", includes=includes)
-            if df:
-                try:
-                    continents = self._to_df(continents, cols=df_cols)
-                    return continents
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable, returning JSON instead.")
-                    return continents
-            else:
-                return continents
-            log.info("Returned %s leagues with includes = %s", len(continents), includes)
+            return self._df_or_json(continents, df, df_cols)
 
 class Countries(BaseAPI):
     """Countries Class"""
 
+    # rarely changes, so responses are cached for a week.
+    cache_ttl = 7 * 24 * 3600
+
     def __init__(self, api_key: Optional[str] = None, timeout: Optional[int] = None):
         super().__init__(api_key, timeout)
 
@@ -105,31 +177,18 @@ class Countries(BaseAPI):
             log.info("Returning country by id: %s, with includes = %s", country_id, includes)
             countries = self.make_request(endpoint=["countries", country_id],
                                           includes=includes, filters=filters)
-            if df:
-                try:
-                    df_countries = self._to_df(countries, cols=df_cols)
-                    return df_countries
-                except NotJSONNormalizable:
-                    log.info("Not JSON-noralizable, returning JSON instead.")
-                    return countries
-            else:
-                return countries
+            return self._df_or_json(countries, df, df_cols)
         else:
             log.info("Returning all countries")
             countries = self.make_request(endpoint="countries", includes=includes)
-            if df:
-                try:
-                    df_countries = self._to_df(countries, cols=df_cols)
-                    return df_countries
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable, returning JSON instead.")
-                    return countries
-            else:
-                return countries
+            return self._df_or_json(countries, df, df_cols)
 
 class Leagues(BaseAPI):
     """Leagues Class"""
 
+    # responses are cached for a day.
+    cache_ttl = 24 * 3600
+
     def __init__(self, api_key: Optional[str] = None, timeout: Optional[int] = None):
         super().__init__(api_key, timeout)
 
@@ -161,27 +220,11 @@ class Leagues(BaseAPI):
             log.info("Return a league by id: %s, with includes = %s", league_id, includes)
             leagues = self.make_request(endpoint=["leagues", league_id],
                                         includes=includes, filters=filters)
-            if df:
-                try:
-                    df_leagues = self._to_df(leagues, cols=df_cols)
-                    return df_leagues
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable; returning JSON instead.")
-                    return leagues
-            else:
-                return leagues
+            return self._df_or_json(leagues, df, df_cols)
         else:
             log.info("Returning all leagues")
             leagues = self.make_request(endpoint="leagues", includes=includes)
-            if df:
-                try:
-                    df_leagues = self._to_df(leagues, cols=df_cols)
-                    return df_leagues
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable; returning JSON instead.")
-                    return leagues
-            else:
-                return leagues
+            return self._df_or_json(leagues, df, df_cols)
 
 
     def by_name(self, search: str, includes: Optional[Union[str, List[str]]] = None,
@@ -207,21 +250,15 @@ class Leagues(BaseAPI):
 
         """
         log.info("Returning a league by search: %s", search)
-        leagues = self.make_request(endpoint=["leagues", "search", search],
-                                    includes=includes, filters=filters)
-        if df:
-            try:
-                df_leagues = self._to_df(leagues, cols=df_cols)
-                return df_leagues
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable; returning JSON.")
-                return leagues
-        else:
-            return leagues
+        leagues = _cached_search(self, "leagues", search, includes=includes, filters=filters)
+        return self._df_or_json(leagues, df, df_cols)
 
 class Seasons(BaseAPI):
     """Seasons API"""
 
+    # responses are cached for a day.
+    cache_ttl = 24 * 3600
+
     def __init__(self, api_key: Optional[str] = None, timeout: Optional[int] = None):
         super().__init__(api_key, timeout)
 
@@ -263,31 +300,19 @@ class Seasons(BaseAPI):
             log.info("Returning season by id: %s, with includes = %s", season_id, includes)
             seasons = self.make_request(endpoint=["seasons", season_id],
                                         includes=includes, filters=filters)
-            if df:
-                try:
-                    df_seasons = self._to_df(seasons, cols=df_cols)
-                    return df_seasons
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable; returning JSON instead.")
-                    return seasons
-            else:
-                return seasons
+            return self._df_or_json(seasons, df, df_cols)
         else:
             log.info("Returning all seasons")
             seasons = self.make_request(endpoint="seasons", includes=includes)
-            if df:
-                try:
-                    df_seasons = self._to_df(seasons, cols=df_cols)
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable; returning JSON instead.")
-                    return seasons
-            else:
-                return seasons
+            return self._df_or_json(seasons, df, df_cols)
 
 
 class Bookmakers(BaseAPI):
     """Bookmakers Class"""
 
+    # rarely changes, so responses are cached for a week.
+    cache_ttl = 7 * 24 * 3600
+
     def __init__(self, api_key: Optional[str] = None, timeout: Optional[int] = None):
         super().__init__(api_key, timeout)
 
@@ -312,32 +337,19 @@ class Bookmakers(BaseAPI):
         if bookmaker_id:
             log.info("Returning bookmaker by id: %s", bookmaker_id)
             bookmakers = self.make_request(endpoint=["bookmakers", bookmaker_id], filters=filters)
-            if df:
-                try:
-                    df_bookmakers = self._to_df(bookmakers, cols=df_cols)
-                    return df_bookmakers
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable, returning JSON.")
-                    return bookmakers
-            else:
-                return bookmakers
+            return self._df_or_json(bookmakers, df, df_cols)
 
         else:
             log.info("Returning all bookmakers")
             bookmakers = self.make_request(endpoint="bookmakers")
-            if df:
-                try:
-                    df_bookmakers = self._to_df(bookmakers, cols=df_cols)
-                    return df_bookmakers
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable, returning JSON.")
-                    return bookmakers
-            else:
-                return bookmakers
+            return self._df_or_json(bookmakers, df, df_cols)
 
 class Markets(BaseAPI):
     """Markets Class"""
 
+    # rarely changes, so responses are cached for a week.
+    cache_ttl = 7 * 24 * 3600
+
     def __init__(self, api_key: Optional[str] = None, timeout: Optional[int] = None):
         super().__init__(api_key, timeout)
 
@@ -362,27 +374,12 @@ class Markets(BaseAPI):
         if market_id:
             log.info("Returning market: %s", market_id)
             markets = self.make_request(endpoint=["markets", market_id], filters=filters)
-            if df:
-                try:
-                    df_markets = self._to_df(markets, cols=df_cols)
-                    return df_markets
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable, returning JSON")
-                    return markets
-            else:
-                return markets
+            return self._df_or_json(markets, df, df_cols)
         else:
             markets = self.make_request(endpoint="markets")
-            log.info("Returning all markets; %s markets", len(markets))
-            if df:
-                try:
-                    df_markets = self._to_df(markets, cols=df_cols)
-                    return df_markets
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable, returning JSON")
-                    return markets
-            else:
-                return markets
+            if log.isEnabledFor(logging.INFO):
+                log.info("Returning all markets; %s markets", len(markets))
+            return self._df_or_json(markets, df, df_cols)
 
 class Teams(BaseAPI):
     """Teams Class"""
@@ -416,15 +413,7 @@ class Teams(BaseAPI):
         """
 
         team = self.make_request(endpoint=["teams", team_id], includes=includes, filters=filters)
-        if df:
-            try:
-                df_team = self._to_df(team, cols=df_cols)
-                return df_team
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return team
-        else:
-            return team
+        return self._df_or_json(team, df, df_cols)
 
 
     def by_season_id(self, season_id: int, includes: Optional[Union[str, List[str]]] = None,
@@ -453,15 +442,7 @@ class Teams(BaseAPI):
 
         teams = self.make_request(endpoint=["teams", "season", season_id],
                                   includes=includes, filters=filters)
-        if df:
-            try:
-                df_teams = self._to_df(teams, cols=df_cols)
-                return df_teams
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return teams
-        else:
-            return teams
+        return self._df_or_json(teams, df, df_cols)
 
     def team_current_leagues(self, team_id: int, filters: Optional[dict] = None,
                              df: bool = False, df_cols: Optional[Union[str, List[str]]] = None):
@@ -479,15 +460,7 @@ class Teams(BaseAPI):
 
         """
         current_leagues = self.make_request(endpoint=["teams", team_id, "current"], filters=filters)
-        if df:
-            try:
-                df_current_leagues = self._to_df(current_leagues, cols=df_cols)
-                return df_current_leagues
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return current_leagues
-        else:
-            return current_leagues
+        return self._df_or_json(current_leagues, df, df_cols)
 
 
     def team_historic_leagues(self, team_id, filters: Optional[dict] = None,
@@ -507,15 +480,7 @@ class Teams(BaseAPI):
         """
         historic_leagues = self.make_request(endpoint=["teams", team_id, "history"],
                                              filters=filters)
-        if df:
-            try:
-                df_historic_leagues = self._to_df(historic_leagues, cols=df_cols)
-                return df_historic_leagues
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return historic_leagues
-        else:
-            return historic_leagues
+        return self._df_or_json(historic_leagues, df, df_cols)
 
     def squads(self, season_id: int, team_id: int,
                includes: Optional[Union[str, List[str]]] = None,
@@ -546,15 +511,7 @@ class Teams(BaseAPI):
         """
         squads = self.make_request(endpoint=["squad", "season", season_id, "team", team_id],
                                    includes=includes, filters=filters)
-        if df:
-            try:
-                df_squads = self._to_df(squads, cols=df_cols)
-                return df_squads
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return squads
-        else:
-            return squads
+        return self._df_or_json(squads, df, df_cols)
 
 
     def head2head(self, team1_id: int, team2_id: int,
@@ -585,15 +542,7 @@ class Teams(BaseAPI):
         h2h = self.make_request(endpoint=["head2head", team1_id, team2_id],
                                 includes=includes, filters=filters)
 
-        if df:
-            try:
-                df_h2h = self._to_df(h2h, cols=df_cols)
-                return df_h2h
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return h2h
-        else:
-            return h2h
+        return self._df_or_json(h2h, df, df_cols)
 
     def head2head_results(self, team1_id: int, team2_id: int,
                           filters: Optional[dict] = None):
@@ -638,19 +587,14 @@ class Commentaries(BaseAPI):
         """
         commentaries = self.make_request(endpoint=["commentaries", "fixture", fixture_id],
                                          filters=filters)[::-1]
-        if df:
-            try:
-                df_commentaries = self._to_df(commentaries, cols=df_cols)
-                return df_commentaries
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return commentaries
-        else:
-            return commentaries
+        return self._df_or_json(commentaries, df, df_cols)
 
 class Venues(BaseAPI):
     """Venues class"""
 
+    # responses are cached for a day.
+    cache_ttl = 24 * 3600
+
     def __init__(self, api_key: Optional[str] = None, timeout: Optional[int] = None):
         super().__init__(api_key, timeout)
 
@@ -673,15 +617,7 @@ class Venues(BaseAPI):
 
         """
         venue = self.make_request(endpoint=["venues", venue_id], filters=filters)
-        if df:
-            try:
-                df_venue = self._to_df(venue, cols=df_cols)
-                return df_venue
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return venue
-        else:
-            return venue
+        return self._df_or_json(venue, df, df_cols)
 
 
     def by_season(self, season_id: int, filters: Optional[dict] = None,
@@ -701,19 +637,14 @@ class Venues(BaseAPI):
 
         """
         venues = self.make_request(endpoint=["venues", "season", season_id], filters=filters)
-        if df:
-            try:
-                df_venues = self._to_df(venues, cols=df_cols)
-                return df_venues
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return venues
-        else:
-            return venues
+        return self._df_or_json(venues, df, df_cols)
 
 class Coaches(BaseAPI):
     """Coaches Class"""
 
+    # responses are cached for a day.
+    cache_ttl = 24 * 3600
+
     def __init__(self, api_key: Optional[str] = None, timeout: Optional[int] = None):
         super().__init__(api_key, timeout)
 
@@ -737,15 +668,7 @@ class Coaches(BaseAPI):
 
         """
         coach = self.make_request(endpoint=["coaches", coach_id], filters=filters)
-        if df:
-            try:
-                df_coach = self._to_df(coach, cols=df_cols)
-                return df_coach
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return coach
-        else:
-            return coach
+        return self._df_or_json(coach, df, df_cols)
 
 class Rounds(BaseAPI):
     """Rounds Class"""
@@ -776,15 +699,7 @@ class Rounds(BaseAPI):
         """
         rounds = self.make_request(endpoint=["rounds", round_id],
                                    includes=includes, filters=filters)
-        if df:
-            try:
-                df_rounds = self._to_df(rounds, cols=df_cols)
-                return df_rounds
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return rounds
-        else:
-            return rounds
+        return self._df_or_json(rounds, df, df_cols)
 
     def by_season(self, season_id: int, filters: Optional[dict] = None,
                   includes: Optional[Union[str, List[str]]] = None,
@@ -809,15 +724,7 @@ class Rounds(BaseAPI):
         """
         rounds = self.make_request(endpoint=["rounds", "season", season_id],
                                    includes=includes, filters=filters)
-        if df:
-            try:
-                df_rounds = self._to_df(rounds, cols=df_cols)
-                return df_rounds
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return rounds
-        else:
-            return rounds
+        return self._df_or_json(rounds, df, df_cols)
 
 class Stages(BaseAPI):
     """Stages Class"""
@@ -848,15 +755,7 @@ class Stages(BaseAPI):
 
         stages = self.make_request(endpoint=["stages", stage_id],
                                    includes=includes, filters=filters)
-        if df:
-            try:
-                df_stages = self._to_df(stages, cols=df_cols)
-                return df_stages
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return stages
-        else:
-            return stages
+        return self._df_or_json(stages, df, df_cols)
 
 
     def by_season(self, season_id: int, includes: Optional[Union[str, List[str]]] = None,
@@ -881,15 +780,7 @@ class Stages(BaseAPI):
 
         seasons = self.make_request(endpoint=["stages", "season", season_id],
                                     includes=includes, filters=filters)
-        if df:
-            try:
-                df_seasons = self._to_df(seasons, cols=df_cols)
-                return df_seasons
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return seasons
-        else:
-            return seasons
+        return self._df_or_json(seasons, df, df_cols)
 
 class Players(BaseAPI):
     """Players Class"""
@@ -920,15 +811,7 @@ class Players(BaseAPI):
 
         player = self.make_request(endpoint=["players", player_id],
                                    includes=includes, filters=filters)
-        if df:
-            try:
-                df_player = self._to_df(player, cols=df_cols)
-                return df_player
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return player
-        else:
-            return player
+        return self._df_or_json(player, df, df_cols)
 
     def by_name(self, search: str, includes: Optional[Union[str, List[str]]] = None,
                 filters: Optional[dict] = None, df: bool = False,
@@ -951,23 +834,146 @@ class Players(BaseAPI):
 
        """
 
-        players = self.make_request(endpoint=["players", "search", search],
-                                    includes=includes, filters=filters)
-        if df:
-            try:
-                df_players = self._to_df(players, cols=df_cols)
-                return df_players
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return players
-        else:
-            return players
+        players = _cached_search(self, "players", search, includes=includes, filters=filters)
+        return self._df_or_json(players, df, df_cols)
+
+class _FixtureBatcher(object):
+    """
+    Coalesces single fixture requests made close together in to
+    fixtures/multi requests. Requests are only batched with others that
+    have the same markets, bookmakers and includes.
+    """
+
+    __slots__ = ("fixtures", "max_delay", "max_batch", "queue", "thread", "closed", "lock")
+
+    # put on the queue to stop the worker thread.
+    _STOP = object()
+
+    def __init__(self, fixtures: "Fixtures", max_delay: float = 0.01, max_batch: int = 50):
+        # a weak reference, so the worker thread doesn't keep the client alive;
+        # the worker is stopped when the client is garbage collected.
+        self.fixtures = weakref.ref(fixtures)
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self.queue = queue.Queue()
+        self.closed = False
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        weakref.finalize(fixtures, self.close, wait=False)
+
+    def submit(self, fixture_id: int, key: tuple):
+        future = Future()
+        with self.lock:
+            if self.closed:
+                raise RuntimeError("Fixture batcher is closed.")
+            self.queue.put((fixture_id, key, future))
+        return future
+
+    def close(self, wait: bool = True):
+        """Stops the worker once the requests already submitted are sent."""
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.queue.put(self._STOP)
+        if wait and threading.current_thread() is not self.thread:
+            self.thread.join()
+
+    def _run(self):
+        stop = False
+        while not stop:
+            item = self.queue.get()
+            if item is self._STOP:
+                return
+
+            batch = [item]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self.queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            groups = {}
+            for fixture_id, key, future in batch:
+                groups.setdefault(key, []).append((fixture_id, future))
+            for key, requests in groups.items():
+                self._flush(key, requests)
+
+    def _flush(self, key: tuple, requests: list):
+        markets, bookmakers, includes = (list(k) if isinstance(k, tuple) else k for k in key)
+        ids = list(dict.fromkeys(fixture_id for fixture_id, _ in requests))
+        try:
+            fixtures = self.fixtures()
+            if fixtures is None:
+                raise RuntimeError("Fixtures client was garbage collected.")
+            response = fixtures.by_id(ids, markets=markets, bookmakers=bookmakers,
+                                      includes=includes)
+        except BaseException as e:  # SystemExit is raised for empty responses.
+            for _, future in requests:
+                future.set_exception(e)
+            return
+
+        response = response if isinstance(response, list) else [response]
+        by_id = {fixt.get("id"): fixt for fixt in response}
+        for fixture_id, future in requests:
+            future.set_result(by_id.get(fixture_id))
+
 
 class Fixtures(BaseAPI):
     """Fixtures Class"""
 
     def __init__(self, api_key: Optional[str] = None, timeout: Optional[int] = None):
         super().__init__(api_key, timeout)
+        self._batcher = None
+        self._batcher_lock = threading.Lock()
+
+    def fixture(self, fixture_id: int,
+                markets: Optional[Union[int, List[int]]] = None,
+                bookmakers: Optional[Union[int, List[int]]] = None,
+                includes: Optional[Union[str, List[str]]] = None):
+
+        """
+        A single fixture, batched with other fixture calls made at about the
+        same time (e.g. from several threads) in to one fixtures/multi request.
+
+        Args:
+            fixture_id:
+                id of the fixture you want to return.
+            markets, bookmakers, includes: optional
+                See by_id. Only calls with the same values are batched together.
+
+        Returns:
+            concurrent.futures.Future of the fixture, JSON format;
+            the result is None if the fixture wasn't returned.
+        """
+        with self._batcher_lock:
+            if self._batcher is None:
+                self._batcher = _FixtureBatcher(self)
+
+        # includes are joined here so "a,b" and ["a", "b"] share a batch.
+        key = tuple(tuple(k) if isinstance(k, list) else k
+                    for k in (markets, bookmakers, self.process_includes(includes)))
+
+        return self._batcher.submit(fixture_id, key)
+
+    def close(self):
+        """
+        Stops the thread batching fixture calls, after sending the calls
+        already made. A later fixture call starts a new one.
+        """
+        with self._batcher_lock:
+            batcher, self._batcher = self._batcher, None
+        if batcher is not None:
+            batcher.close()
 
     def by_id(self, fixture_ids: Union[int, List[int]],
               markets: Optional[Union[int, List[int]]] = None,
@@ -1004,33 +1010,17 @@ class Fixtures(BaseAPI):
 
         """
         params = {"markets": markets, "bookmakers": bookmakers}
-        log.info("Params in fixtures: %s", params)
+        log.debug("Params in fixtures: %s", params)
 
-        if isinstance(fixture_ids, list):
-            fixture_ids = ",".join(list(map(str, fixture_ids)))
-            fixtures = self.make_request(endpoint=["fixtures", "multi", fixture_ids],
-                                         includes=includes, params=params, filters=filters)
-            if df:
-                try:
-                    df_fixtures = self._to_df(fixtures, cols=df_cols)
-                    return df_fixtures
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable, returning JSON.")
-                    return fixtures
-            else:
-                return fixtures
-        else:
-            fixtures = self.make_request(endpoint=["fixtures", fixture_ids],
+        # a single id is the common case, so it's checked first.
+        if not isinstance(fixture_ids, (list, tuple)):
+            fixtures = self.make_request(endpoint=("fixtures", fixture_ids),
                                          includes=includes, params=params)
-            if df:
-                try:
-                    df_fixtures = self._to_df(fixtures, cols=df_cols)
-                    return df_fixtures
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable, returning JSON.")
-                    return fixtures
-            else:
-                return fixtures
+        else:
+            fixtures = self.make_request(endpoint=("fixtures", "multi",
+                                                   ",".join(map(str, fixture_ids))),
+                                         includes=includes, params=params, filters=filters)
+        return self._df_or_json(fixtures, df, df_cols)
 
     def by_date(self, date: str, league_ids: Optional[Union[int, List[int]]] = None,
                 markets: Optional[Union[int, List[int]]] = None,
@@ -1075,15 +1065,7 @@ class Fixtures(BaseAPI):
 
         fixtures = self.make_request(endpoint=["fixtures", "date", date],
                                      includes=includes, params=params, filters=filters)
-        if df:
-            try:
-                df_fixtures = self._to_df(fixtures, cols=df_cols)
-                return df_fixtures
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return fixtures
-        else:
-            return fixtures
+        return self._df_or_json(fixtures, df, df_cols)
 
     def by_date_range(self, start_date: str, end_date: str,
                       team_id: Optional[int] = None,
@@ -1134,27 +1116,89 @@ class Fixtures(BaseAPI):
             fixtures = self.make_request(endpoint=["fixtures", "between", start_date, end_date,
                                                    team_id],
                                          includes=includes, params=params, filters=filters)
-            if df:
-                try:
-                    df_fixtures = self._to_df(fixtures, cols=df_cols)
-                    return df_fixtures
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable, returning JSON.")
-                    return fixtures
-            else:
-                return fixtures
+            return self._df_or_json(fixtures, df, df_cols)
         else:
             fixtures = self.make_request(endpoint=["fixtures", "between", start_date, end_date],
                                          includes=includes, params=params)
-            if df:
-                try:
-                    df_fixtures = self._to_df(fixtures, cols=df_cols)
-                    return df_fixtures
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable, returning JSON.")
-                    return fixtures
-            else:
-                return fixtures
+            return self._df_or_json(fixtures, df, df_cols)
+
+    def by_date_range_pages(self, start_date: str, end_date: str,
+                            team_id: Optional[int] = None,
+                            league_ids: Optional[Union[int, List[int]]] = None,
+                            markets: Optional[Union[int, List[int]]] = None,
+                            bookmakers: Optional[Union[int, List[int]]] = None,
+                            includes: Optional[Union[str, List[str]]] = None,
+                            filters: Optional[dict] = None):
+        """
+        Fixtures between start_date and end_date, one page at a time.
+        Takes the same arguments as by_date_range.
+
+        Returns:
+            Generator of pages; each a list of fixtures in JSON format.
+        """
+
+        params = {"leagues": league_ids, "markets": markets, "bookmakers": bookmakers}
+        endpoint = ["fixtures", "between", start_date, end_date]
+        if team_id:
+            endpoint.append(team_id)
+
+        return self.iter_pages(endpoint=endpoint, includes=includes, params=params,
+                               filters=filters)
+
+    def by_date_range_parallel(self, start_date: str, end_date: str,
+                               chunk_days: int = 7, max_workers: int = 8,
+                               team_id: Optional[int] = None,
+                               league_ids: Optional[Union[int, List[int]]] = None,
+                               markets: Optional[Union[int, List[int]]] = None,
+                               bookmakers: Optional[Union[int, List[int]]] = None,
+                               includes: Optional[Union[str, List[str]]] = None,
+                               filters: Optional[dict] = None,
+                               df: bool = False,
+                               df_cols: Optional[Union[str, List[str]]] = None):
+        """
+        Fixtures between start_date and end_date, fetched as chunk_days long
+        ranges concurrently, which avoids long ranges timing out.
+        Otherwise takes the same arguments as by_date_range.
+
+        Args:
+            chunk_days: optional
+                Number of days in each request.
+            max_workers: optional
+                Maximum number of requests made at once.
+
+        Returns:
+            Fixtures in date order, JSON format (an empty list if there are none).
+            A fixture returned by two chunks is only included once.
+        """
+        if chunk_days < 1:
+            raise ValueError(f"chunk_days must be at least 1, got {chunk_days}")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+        step = timedelta(days=chunk_days)
+        ranges = []
+        while start <= end:
+            chunk_end = min(start + step - timedelta(days=1), end)
+            ranges.append((start.isoformat(), chunk_end.isoformat()))
+            start = chunk_end + timedelta(days=1)
+
+        # by_date_range_pages doesn't treat a chunk with no fixtures as an error.
+        def fetch(dates):
+            return list(chain.from_iterable(
+                self.by_date_range_pages(*dates, team_id=team_id, league_ids=league_ids,
+                                         markets=markets, bookmakers=bookmakers,
+                                         includes=includes, filters=filters)))
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(ranges) or 1)) as pool:
+            # a fixture near midnight can fall in both neighbouring chunks,
+            # depending on the timezone; keep the first.
+            unique = {}
+            for fixture in chain.from_iterable(pool.map(fetch, ranges)):
+                unique.setdefault(fixture["id"], fixture)
+        fixtures = list(unique.values())
+
+        return self._df_or_json(fixtures, df, df_cols)
 
     def inplay_fixtures(self, markets: Optional[Union[int, List[int]]] = None,
                         bookmakers: Optional[Union[int, List[int]]] = None,
@@ -1193,16 +1237,8 @@ class Fixtures(BaseAPI):
 
         params = {"leagues": league_ids, "markets": markets, "bookmakers": bookmakers}
         fixtures = self.make_request(endpoint=["livescores", "now"], includes=includes,
-                                     params=params, filters=filters)
-        if df:
-            try:
-                df_fixtures = self._to_df(fixtures, cols=df_cols)
-                return df_fixtures
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return fixtures
-        else:
-            return fixtures
+                                     params=params, filters=filters, ttl=5)
+        return self._df_or_json(fixtures, df, df_cols)
 
 class FixtureStats(Fixtures):
     """Fixtures Statistics"""
@@ -1285,7 +1321,7 @@ class FixtureStats(Fixtures):
         player_stats = []
         if isinstance(response, list):
             for fixt in response:
-                player_stats += [i for i in fixt.get("lineup")]
+                player_stats.extend(fixt["lineup"])
         elif isinstance(response, dict):
             player_stats = response["lineup"]
         else:
@@ -1309,7 +1345,7 @@ class FixtureStats(Fixtures):
         player_stats = []
         if isinstance(response, list):
             for fixt in response:
-                player_stats += [i for i in fixt.get("lineup")]
+                player_stats.extend(fixt["lineup"])
         elif isinstance(response, dict):
             player_stats = response["lineup"]
         else:
@@ -1360,19 +1396,14 @@ class Schedule(BaseAPI):
         params = {"leagues": league_ids, "markets": markets, "bookmakers": bookmakers}
         schedule = self.make_request(endpoint="livescores", includes=includes,
                                      params=params, filters=filters)
-        if df:
-            try:
-                df_schedule = self._to_df(schedule, cols=df_cols)
-                return df_schedule
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return schedule
-        else:
-            return schedule
+        return self._df_or_json(schedule, df, df_cols)
 
 class Standings(BaseAPI):
     """Standings Class"""
 
+    # responses are cached for five minutes.
+    cache_ttl = 300
+
     def __init__(self, api_key: Optional[str] = None, timeout: Optional[int] = None):
         super().__init__(api_key, timeout)
 
@@ -1407,17 +1438,9 @@ class Standings(BaseAPI):
 
         """
         params = {"stage_ids": stage_ids, "group_ids": group_ids}
-        standings = self.make_request(endpoint=["standings", "season", season_id],
+        standings = self.make_request(endpoint=f"standings/season/{season_id}",
                                       includes=includes, params=params, filters=filters)
-        if df:
-            try:
-                df_standings = self._to_df(standings, cols=df_cols)
-                return df_standings
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return standings
-        else:
-            return standings
+        return self._df_or_json(standings, df, df_cols)
 
     def by_date(self, season_id: int, date: str, filters: Optional[dict] = None,
                 df: bool = False, df_cols: Optional[Union[str, List[str]]] = None):
@@ -1440,28 +1463,47 @@ class Standings(BaseAPI):
             JSON format.
 
         """
-        standings = self.make_request(endpoint=["standings", "season", season_id, "date", date],
-                                      filters=filters)
-        if df:
-            try:
-                df_standings = self._to_df(standings, cols=df_cols)
-                return df_standings
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return standings
-        else:
-            return standings
+        # standings at a past date won't change, so they're kept for longer.
+        ttl = PAST_STANDINGS_TTL if str(date) < time.strftime("%Y-%m-%d") else None
+        standings = self.make_request(endpoint=f"standings/season/{season_id}/date/{date}",
+                                      filters=filters, ttl=ttl)
+        return self._df_or_json(standings, df, df_cols)
+
+    def prefetch(self, season_id: int, dates: List[str], max_workers: int = 8):
+        """
+        Warms the response cache with the season's standings and its standings
+        at each of dates, fetched concurrently, so later by_season/by_date
+        calls for them are served from memory.
+
+        Args:
+            season_id:
+                id of the season you want to prefetch.
+            dates:
+                Dates (YYYY-MM-DD) you will want standings at.
+            max_workers: optional
+                Maximum number of requests made at once.
+        """
+        calls = [lambda: self.by_season(season_id)]
+        calls += [lambda d=d: self.by_date(season_id, d) for d in dict.fromkeys(dates)]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for future in [pool.submit(call) for call in calls]:
+                future.result()
 
 class TopScorers(BaseAPI):
     """Topscorers Class"""
 
+    # responses are cached for an hour.
+    cache_ttl = 3600
+
     def __init__(self, api_key: Optional[str] = None, timeout: Optional[int] = None):
         super().__init__(api_key, timeout)
 
     def topscorers(self, season_id: int, stage_ids: Optional[Union[int, List[int]]] = None,
                    includes: Optional[Union[str, List[str]]] = None,
                    filters: Optional[dict] = None, df: bool = False,
-                   df_cols: Optional[Union[str, List[str]]] = None):
+                   df_cols: Optional[Union[str, List[str]]] = None,
+                   no_cache: bool = False):
 
         """
         The Topscorers endpoint provides you accurate information about the Topscorers in Goals,
@@ -1482,6 +1524,8 @@ class TopScorers(BaseAPI):
                 assistscorers.player, assistscorers.team, cardscorers.player,
                 cardscorers.team.
                 ***See Sportmonks.com for information regarding includes.
+            no_cache: optional
+                If True, skips the response cache.
 
         Returns:
             Parsed HTTP response from SportMonks API.
@@ -1489,23 +1533,18 @@ class TopScorers(BaseAPI):
 
         """
 
+        includes = _validate_includes(includes, TOPSCORERS_INCLUDES)
         params = {"stage_ids": stage_ids}
-        topscorers = self.make_request(endpoint=["topscorers", "season", season_id],
-                                       includes=includes, params=params, filters=filters)
-        if df:
-            try:
-                df_topscorers = self._to_df(topscorers, cols=df_cols)
-                return df_topscorers
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return topscorers
-        else:
-            return topscorers
+        topscorers = self.make_request(endpoint=f"topscorers/season/{season_id}",
+                                       includes=includes, params=params, filters=filters,
+                                       no_cache=no_cache)
+        return self._df_or_json(topscorers, df, df_cols)
 
     def aggregated_topscorers(self, season_id: int,
                               includes: Optional[Union[str, List[str]]] = None,
                               filters: Optional[dict] = None,
-                              df: bool = False, df_cols: Optional[Union[str, List[str]]] = None):
+                              df: bool = False, df_cols: Optional[Union[str, List[str]]] = None,
+                              no_cache: bool = False):
 
         """
         This Topscorers endpoint returns the Aggregated Topscorers by Season.
@@ -1519,33 +1558,34 @@ class TopScorers(BaseAPI):
                 aggregatedAssistscorers.player, aggregatedAssistscorers.team,
                 aggregatedCardscorers.player, aggregatedCardscorers.team.
                 ***See Sportmonks.com for information regarding includes.
+            no_cache: optional
+                If True, skips the response cache.
 
         Returns:
             Parsed HTTP response from SportMonks API.
             JSON format.
 
         """
-        topscorers = self.make_request(endpoint=["topscorers", "season", season_id, "aggregated"],
-                                       includes=includes, filters=filters)
-        if df:
-            try:
-                df_topscorers = self._to_df(topscorers, cols=df_cols)
-                return df_topscorers
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return topscorers
-        else:
-            return topscorers
+        includes = _validate_includes(includes, AGGREGATED_TOPSCORERS_INCLUDES)
+        topscorers = self.make_request(endpoint=f"topscorers/season/{season_id}/aggregated",
+                                       includes=includes, filters=filters, no_cache=no_cache)
+        return self._df_or_json(topscorers, df, df_cols)
 
 class Odds(BaseAPI):
     """Odds Class"""
 
+    # pre-match odds are cached for a minute, in-play odds for 5 seconds.
+    cache_ttl = 60
+
     def __init__(self, api_key: Optional[str] = None, timeout: Optional[int] = None):
         super().__init__(api_key, timeout)
+        # AsyncSportMonks sharing this client's settings and caches, for odds_many.
+        self._async = None
 
     def odds(self, fixture_id: int, bookmaker_id: Optional[int] = None,
              market_id: Optional[int] = None, filters: Optional[dict] = None,
-             df: bool = False, df_cols: Optional[Union[str, List[str]]] = None):
+             df: bool = False, df_cols: Optional[Union[str, List[str]]] = None,
+             no_cache: bool = False):
 
         """
         Odds are used to add betting functionality to your application.
@@ -1560,75 +1600,60 @@ class Odds(BaseAPI):
                 id of the bookmaker you want odds info from.
             market_id:
                 id of the market you want odds info from.
+            no_cache: optional
+                If True, skips the response cache.
 
         Returns:
             Parsed HTTP response from SportMonks API.
             JSON format.
 
         """
-        if bookmaker_id and market_id:
-            raise IncompatibleArgs("No endpoint for market and bookmaker id. Use \
-                                   the filters keyword with market_id or bookmaker_id endpoint.")
-        elif bookmaker_id:
-            odds = self.make_request(endpoint=["odds", "fixture", fixture_id,
-                                               "bookmaker", bookmaker_id], filters=filters)
-            if df:
-                try:
-                    df_odds = self._to_df(odds, cols=df_cols)
-                    return df_odds
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable, returning JSON.")
-                    return odds
-            else:
-                return odds
-
-        elif market_id:
-            odds = self.make_request(endpoint=["odds", "fixture", fixture_id,
-                                               "market", market_id], filters=filters)
-            if df:
-                new_json = {"id": fixture_id}
-                odds = odds[0] if len(odds) != 0 else None
-                new_json["market_id"] = odds.get("id")
-                new_json["market"] = odds.get("name")
-                bookmakers = odds.get("bookmaker")
-
-                for i in bookmakers:
-                    actual_odds = i.get("odds")
-
-                    for j in actual_odds:
-                        if j.get("total") is not None:
-                            if ("." in  j.get("total")) and \
-                               (j.get("total").split(".")[1] == "5"):
-                               # only want Over1.5, Under2.5 for example.
-                                new_json[
-                                    i.get("name") + "_" + j.get("label") + str(j.get("total"))
-                                ] = j.get("value")
-
-                        else:
-                            new_json[i.get("name") + "_" +
-                                     j.get("label")] = j.get("value")
-                try:
-                    df_odds = self._to_df(new_json, cols=df_cols)
-                    return df_odds
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable, returning JSON.")
-                    return odds
-            else:
-                return odds
+        odds = self.make_request(endpoint=_odds_endpoint(fixture_id, bookmaker_id, market_id),
+                                 filters=filters, no_cache=no_cache)
+        if market_id and df:
+            odds = _market_row(fixture_id, odds)
+        return self._df_or_json(odds, df, df_cols)
+
+    def odds_many(self, fixture_ids: List[int], bookmaker_id: Optional[int] = None,
+                  market_id: Optional[int] = None, filters: Optional[dict] = None,
+                  no_cache: bool = False):
+        """
+        Odds for several fixtures, requested concurrently, through the same
+        response cache as odds. Requires aiohttp. Sync only: from a running
+        event loop, await AsyncSportMonks.odds_many instead.
+
+        Args:
+            fixture_ids:
+                ids of the fixtures you want odds for.
+            bookmaker_id, market_id, filters, no_cache: optional
+                See odds.
+
+        Returns:
+            List of the odds of each fixture, in the order of fixture_ids.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
         else:
-            odds = self.make_request(endpoint=["odds", "fixture", fixture_id], filters=filters)
-            if df:
-                try:
-                    df_odds = self._to_df(odds, cols=df_cols)
-                    return df_odds
-                except NotJSONNormalizable:
-                    log.info("Not JSON-normalizable, returning JSON.")
-                    return odds
-            else:
-                return odds
+            raise RuntimeError("Odds.odds_many can't be called from a running event loop; "
+                               "await AsyncSportMonks.odds_many instead.")
+
+        if self._async is None:
+            self._async = AsyncSportMonks.from_client(self)
+
+        async def fetch():
+            # the aiohttp session is bound to this call's event loop.
+            async with self._async as sm:
+                return await sm.odds_many(fixture_ids, bookmaker_id=bookmaker_id,
+                                          market_id=market_id, filters=filters,
+                                          no_cache=no_cache)
+
+        return asyncio.run(fetch())
 
     def live_odds(self, fixture_id: int, filters: Optional[dict] = None,
-                  df: bool = False, df_cols: Optional[Union[str, List[str]]] = None):
+                  df: bool = False, df_cols: Optional[Union[str, List[str]]] = None,
+                  no_cache: bool = False):
         """
         In play odds by fixture
         ***MUST HAVE ADVANCED SPORTMONKS PLAN
@@ -1637,23 +1662,17 @@ class Odds(BaseAPI):
         Args:
             fixture_id:
                 id of the fixture you want live odds for.
+            no_cache: optional
+                If True, skips the response cache.
 
         Returns:
             Parsed HTTP response from SportMonks API.
             JSON format.
 
         """
-        odds = self.make_request(endpoint=["odds", "inplay", "fixture", fixture_id],
-                                 filters=filters)
-        if df:
-            try:
-                df_odds = self._to_df(odds, cols=df_cols)
-                return df_odds
-            except NotJSONNormalizable:
-                log.info("Not JSON-normalizable, returning JSON.")
-                return odds
-        else:
-            return odds
+        odds = self.make_request(endpoint=f"odds/inplay/fixture/{fixture_id}",
+                                 filters=filters, no_cache=no_cache, ttl=5)
+        return self._df_or_json(odds, df, df_cols)
 
     @staticmethod
     def _preprocess(df: pd.DataFrame, label: str):
@@ -1699,3 +1718,112 @@ class Odds(BaseAPI):
             return None
 
         return round(market_label.mean(axis=1)[0], 2)
+
+
+class AsyncSportMonks(AsyncBaseAPI):
+    """
+    Coroutine versions of the most used endpoints, for fanning out many
+    requests at once. Requires aiohttp.
+
+    async with AsyncSportMonks() as sm:
+        fixt, h2h = await sm.gather(sm.fixtures(1), sm.head2head(1, 2))
+    """
+
+    def __init__(self, api_key: Optional[str] = None, timeout: Optional[int] = None):
+        super().__init__(api_key, timeout)
+
+    async def fixtures(self, fixture_ids: Union[int, List[int]],
+                       markets: Optional[Union[int, List[int]]] = None,
+                       bookmakers: Optional[Union[int, List[int]]] = None,
+                       includes: Optional[Union[str, List[str]]] = None,
+                       filters: Optional[dict] = None):
+        """See Fixtures.by_id."""
+
+        params = {"markets": markets, "bookmakers": bookmakers}
+        if not isinstance(fixture_ids, (list, tuple)):
+            endpoint = ("fixtures", fixture_ids)
+        else:
+            endpoint = ("fixtures", "multi", ",".join(map(str, fixture_ids)))
+
+        return await self.make_request_async(endpoint=endpoint, includes=includes,
+                                             params=params, filters=filters)
+
+    async def fixtures_by_date(self, date: str,
+                               league_ids: Optional[Union[int, List[int]]] = None,
+                               markets: Optional[Union[int, List[int]]] = None,
+                               bookmakers: Optional[Union[int, List[int]]] = None,
+                               includes: Optional[Union[str, List[str]]] = None,
+                               filters: Optional[dict] = None):
+        """See Fixtures.by_date."""
+
+        params = {"leagues": league_ids, "markets": markets, "bookmakers": bookmakers}
+        return await self.make_request_async(endpoint=["fixtures", "date", date],
+                                             includes=includes, params=params,
+                                             filters=filters)
+
+    async def head2head(self, team1_id: int, team2_id: int,
+                        includes: Optional[Union[str, List[str]]] = None,
+                        filters: Optional[dict] = None):
+        """See Teams.head2head."""
+
+        return await self.make_request_async(endpoint=["head2head", team1_id, team2_id],
+                                             includes=includes, filters=filters)
+
+    async def standings(self, season_id: int,
+                        includes: Optional[Union[str, List[str]]] = None,
+                        group_ids: Optional[Union[int, List[int]]] = None,
+                        stage_ids: Optional[Union[int, List[int]]] = None,
+                        filters: Optional[dict] = None):
+        """See Standings.by_season."""
+
+        params = {"stage_ids": stage_ids, "group_ids": group_ids}
+        return await self.make_request_async(endpoint=f"standings/season/{season_id}",
+                                             includes=includes, params=params,
+                                             filters=filters)
+
+    async def commentaries(self, fixture_id: int, filters: Optional[dict] = None):
+        """See Commentaries.commentaries."""
+
+        return await self.make_request_async(endpoint=["commentaries", "fixture", fixture_id],
+                                             filters=filters)
+
+    async def topscorers(self, season_id: int,
+                         stage_ids: Optional[Union[int, List[int]]] = None,
+                         includes: Optional[Union[str, List[str]]] = None,
+                         filters: Optional[dict] = None):
+        """See TopScorers.topscorers."""
+
+        includes = _validate_includes(includes, TOPSCORERS_INCLUDES)
+        return await self.make_request_async(endpoint=f"topscorers/season/{season_id}",
+                                             includes=includes,
+                                             params={"stage_ids": stage_ids},
+                                             filters=filters)
+
+    async def aggregated_topscorers(self, season_id: int,
+                                    includes: Optional[Union[str, List[str]]] = None,
+                                    filters: Optional[dict] = None):
+        """See TopScorers.aggregated_topscorers."""
+
+        includes = _validate_includes(includes, AGGREGATED_TOPSCORERS_INCLUDES)
+        return await self.make_request_async(
+            endpoint=f"topscorers/season/{season_id}/aggregated",
+            includes=includes, filters=filters)
+
+    async def odds(self, fixture_id: int, bookmaker_id: Optional[int] = None,
+                   market_id: Optional[int] = None, filters: Optional[dict] = None,
+                   no_cache: bool = False):
+        """See Odds.odds."""
+
+        return await self.make_request_async(
+            endpoint=_odds_endpoint(fixture_id, bookmaker_id, market_id), filters=filters,
+            no_cache=no_cache)
+
+    async def odds_many(self, fixture_ids: List[int], bookmaker_id: Optional[int] = None,
+                        market_id: Optional[int] = None, filters: Optional[dict] = None,
+                        no_cache: bool = False):
+        """Odds for each of fixture_ids, requested concurrently, in the same order."""
+
+        return await self.gather(*[self.odds(fixture_id, bookmaker_id=bookmaker_id,
+                                             market_id=market_id, filters=filters,
+                                             no_cache=no_cache)
+                                   for fixture_id in fixture_ids])
@@ -0,0 +1,207 @@
+"""Test the database helpers"""
+
+import os
+import sys
+import unittest
+from io import StringIO
+from unittest.mock import MagicMock, patch
+import pandas as pd
+import sqlalchemy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "database"))
+
+import to_database
+from to_database import (standardise_columns, _copy_from_df, _nullable_ints, _valid_label,
+                         odds_includes, odds_long)
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+class TestStandardiseColumns(unittest.TestCase):
+
+    """Testing odds label standardisation"""
+
+    def test_home_draw_away(self):
+
+        """Test Home/Draw/Away labels map to 1/X/2, and team names fuzzy match"""
+
+        labels = [{"label": "Home | Yes"}, {"label": "Draw | Yes"},
+                  {"label": "Away | No"}, {"label": "Man Utd | Yes"},
+                  {"label": "Liverpool | No"}, {"label": "Draw"}]
+
+        response = standardise_columns(labels, "Manchester United", "Liverpool")
+
+        self.assertEqual(["1/Yes", "X/Yes", "2/No", "1/Yes", "2/No", "X"],
+                         [x["label"] for x in response])
+
+    def test_valid_label(self):
+
+        """Test Result/BTTS labels are checked with or without spaces around the /"""
+
+        for label in ("1/Yes", "X/No", "1 / Yes", "X / No", " 2/ Yes"):
+            self.assertTrue(_valid_label(976316, label), label)
+        for label in ("1/Maybe", "Yes", "1/X/Yes", "3 / No"):
+            self.assertFalse(_valid_label(976316, label), label)
+
+
+
+class TestOdds(unittest.TestCase):
+
+    """Testing the wide and long odds tables"""
+
+    @staticmethod
+    def _fixture():
+        over_under = [{"label": "Over", "total": total, "value": value}
+                      for total, value in (("2.5", "1.9"), ("2", "1.4"), ("2.25", "1.6"))]
+        result = [{"label": label, "total": None, "value": value}
+                  for label, value in (("Home", "2.1"), ("Draw", "3.3"), ("Away", "3.6"))]
+        return [{"id": 1, "localTeam": {"name": "Liverpool"},
+                 "visitorTeam": {"name": "Everton"},
+                 "odds": [{"id": 12, "name": "Over/Under",
+                           "bookmaker": [{"name": "bet365", "odds": over_under}]},
+                          {"id": 1, "name": "3Way Result",
+                           "bookmaker": [{"name": "bet365", "odds": result}]}]}]
+
+    def test_odds_includes(self):
+
+        """Test one wide table per market, with only the .5 total lines"""
+
+        tables = dict(odds_includes(self._fixture(), markets=None, table="fixt"))
+
+        self.assertEqual([{"id": 1, "market_id": 12, "market": "Over/Under",
+                           "bet365_Over2.5": "1.9"}], tables["fixt_Over/Under"])
+        self.assertEqual([{"id": 1, "market_id": 1, "market": "3Way Result",
+                           "bet365_1": "2.1", "bet365_X": "3.3", "bet365_2": "3.6"}],
+                         tables["fixt_3Way_Result"])
+
+    def test_odds_long(self):
+
+        """Test the long table keeps the same odds as the wide tables"""
+
+        (name, df), = odds_long(self._fixture(), markets=None, table="fixt")
+
+        self.assertEqual("fixt_odds", name)
+        self.assertEqual([(12, "Over", "2.5", "1.9"), (1, "1", "", "2.1"),
+                          (1, "X", "", "3.3"), (1, "2", "", "3.6")],
+                         list(df[["market_id", "label", "total", "value"]].fillna("")
+                              .itertuples(index=False, name=None)))
+
+        (_, df), = odds_long(self._fixture(), markets=12, table="fixt")
+        self.assertEqual([12], df["market_id"].tolist())
+
+
+
+class TestCopy(unittest.TestCase):
+
+    """Testing COPY writes"""
+
+    def test_nullable_ints(self):
+
+        """Test int columns with missing values are written without a .0"""
+
+        df = pd.DataFrame({"attendance": [12000, None], "temp": [12.5, None],
+                           "empty": [None, None], "name": ["a", "b"]})
+
+        buf = StringIO()
+        _nullable_ints(df).to_csv(buf, index=False, header=False, na_rep="\\N")
+
+        self.assertEqual("12000,12.5,\\N,a\n\\N,\\N,\\N,b\n", buf.getvalue())
+
+    def test_reflect_once(self):
+
+        """Test repeated inserts in to a table reuse the one reflection of it"""
+
+        engine = sqlalchemy.create_engine("sqlite://")
+        with engine.begin() as con:
+            con.execute(sqlalchemy.text("CREATE TABLE odds (id INTEGER, value TEXT)"))
+            with patch.object(to_database.sqlalchemy, "Table",
+                              wraps=sqlalchemy.Table) as mock_table:
+                for i in range(3):
+                    to_database._bulk_insert([{"id": i, "value": "1.5"}], "odds", con)
+                to_database._forget_table("odds", con)
+                to_database._bulk_insert([{"id": 3, "value": "2.5"}], "odds", con)
+
+            self.assertEqual(2, mock_table.call_count)
+            self.assertEqual(4, con.execute(sqlalchemy.text("SELECT COUNT(*) FROM odds")).scalar())
+
+    @unittest.skipUnless(TEST_DATABASE_URL, "TEST_DATABASE_URL is not set")
+    def test_append_nullable_int(self):
+
+        """Test a None-bearing int column appends in to an existing BIGINT column"""
+
+        engine = sqlalchemy.create_engine(TEST_DATABASE_URL)
+        table = "test_copy_nullable_int"
+        try:
+            _copy_from_df(pd.DataFrame({"id": [1], "attendance": [500]}), table,
+                          engine, if_exists="replace")
+            _copy_from_df(pd.DataFrame({"id": [2, 3], "attendance": [12000, None]}), table,
+                          engine, if_exists="append")
+
+            with engine.connect() as con:
+                rows = con.execute(sqlalchemy.text(
+                    f"SELECT id, attendance FROM {table} ORDER BY id")).fetchall()
+            self.assertEqual([(1, 500), (2, 12000), (3, None)], [tuple(r) for r in rows])
+        finally:
+            with engine.begin() as con:
+                con.execute(sqlalchemy.text(f"DROP TABLE IF EXISTS {table}"))
+            engine.dispose()
+
+
+class TestFixturesToSql(unittest.TestCase):
+
+    """Testing the paged fixtures load"""
+
+    def setUp(self):
+
+        """Executed before any test"""
+
+        self.engine = MagicMock()
+        self.con = self.engine.begin.return_value.__enter__.return_value
+        self.con.execute.return_value.fetchall.return_value = []
+        # page 1 has odds for market A, page 2 for markets A and B.
+        self.pages = [
+            ("fixt", [("fixt", pd.DataFrame({"id": [1]}))], [("fixt_A", [{"id": 1}])]),
+            ("fixt", [("fixt", pd.DataFrame({"id": [2]}))], [("fixt_A", [{"id": 2}]),
+                                                             ("fixt_B", [{"id": 2}])]),
+        ]
+
+    def _load(self, to_psql):
+        with patch.object(to_database, "Fixtures") as fixtures, \
+                patch.object(to_database, "_prepare_fixtures", side_effect=self.pages), \
+                patch.object(to_database, "to_psql", side_effect=to_psql) as mock_to_psql:
+            fixtures.return_value.by_date_range_pages.return_value = iter([[{}], [{}]])
+            to_database.fixtures_data_to_sql("2021-01-01", "2021-01-02", 8, "fixt",
+                                             self.engine, if_exists="replace",
+                                             includes="odds")
+        return mock_to_psql
+
+    def test_one_transaction(self):
+
+        """Test every page is written on one connection, and tables are only replaced once"""
+
+        mock_to_psql = self._load(None)
+
+        self.engine.begin.assert_called_once()
+        self.assertEqual([("fixt", "replace"), ("fixt_A", "replace"),
+                          ("fixt", "append"), ("fixt_A", "append"), ("fixt_B", "replace")],
+                         [(c[1]["table"], c[1]["if_exists"]) for c in mock_to_psql.call_args_list])
+        self.assertTrue(all(c[1]["engine"] is self.con for c in mock_to_psql.call_args_list))
+
+    def test_failed_page(self):
+
+        """Test an error on a later page leaves the transaction to be rolled back"""
+
+        def to_psql(response, table, **kwargs):
+            if table == "fixt_B":
+                raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            self._load(to_psql)
+
+        self.engine.begin.assert_called_once()
+        exc_type = self.engine.begin.return_value.__exit__.call_args[0][0]
+        self.assertIs(ValueError, exc_type)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,28 @@
 """Test the SM API wrapper"""
 
 import os
+import gc
+import asyncio
+import sys
+import json
+import time
+import threading
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 import pytest
 import requests
+import base
 from base import BaseAPI
+from football import (
+    AsyncSportMonks,
+    Continents,
+    Fixtures,
+    Odds,
+    Standings,
+    _FixtureBatcher,
+    _validate_includes,
+    TOPSCORERS_INCLUDES,
+)
 
 from errors import (
     BadRequest,
@@ -15,8 +32,18 @@ from errors import (
     TooManyRequests,
     ServerErrors,
     APIKeyMissing,
+    InvalidIncludes,
 )
 
+
+def _response(data, status_code=200):
+    """A mock requests response with JSON data."""
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.headers = {}
+    mock_response.content = json.dumps(data).encode()
+    return mock_response
+
 class TestBase(unittest.TestCase):
 
     """Testing Class"""
@@ -25,9 +52,14 @@ class TestBase(unittest.TestCase):
 
         """Executed before any test"""
 
-        self.base = BaseAPI(api_key="foo")
+        # the plan info request isn't under test.
+        with patch.object(BaseAPI, "meta_info"):
+            self.base = BaseAPI(api_key="foo")
+        patcher = patch.object(base, "_bucket", base._TokenBucket(0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
-    @patch("base.requests.get")
+    @patch("base.requests.Session.get")
     def test_exceptions(self, mock_get):
 
         """Test BaseAPI raises the correct exceptions"""
@@ -43,7 +75,7 @@ class TestBase(unittest.TestCase):
 
         mock_response = Mock()
         expected_response = {"data": {"foo": "bar"}, "error": {"foo": "bar"}}
-        mock_response.json.return_value = expected_response
+        mock_response.content = json.dumps(expected_response).encode()
         mock_get.return_value = mock_response
 
         for exception in error_status_codes:
@@ -56,23 +88,22 @@ class TestBase(unittest.TestCase):
 
             self.assertRaises(exception, self.base.make_request, "foo")
 
-    @patch("base.requests.get")
+    @patch("base.requests.Session.get")
     def test_successful_call(self, mock_get):
 
         """Test a successful request"""
 
         mock_response = Mock()
         expected_response = {"data": {"foo":"bar"}}
-        mock_response.json.return_value = expected_response
+        mock_response.content = json.dumps(expected_response).encode()
         mock_get.return_value = mock_response
 
         response_dict = self.base.make_request("foo")
 
         mock_get.assert_called_once()
-        self.assertEqual(1, mock_response.json.call_count)
         self.assertEqual({"foo": "bar"}, response_dict)
 
-    @patch("base.requests.get")
+    @patch("base.requests.Session.get")
     def test_args(self, mock_get):
 
         """Test the arguments passed to requests.get()"""
@@ -81,7 +112,7 @@ class TestBase(unittest.TestCase):
 
         mock_response = Mock()
         expected_response = {"data": {"foo":"bar"}}
-        mock_response.json.return_value = expected_response
+        mock_response.content = json.dumps(expected_response).encode()
         mock_get.return_value = mock_response
 
         for endpoint in ["foo", "bar", ["foo", "bar"]]:
@@ -97,6 +128,420 @@ class TestBase(unittest.TestCase):
             self.assertEqual(mock_get.call_args[1]["timeout"], 10)
             self.assertEqual(mock_get.call_args[1]["params"].get("include"), "foo")
 
+    @patch("base.requests.Session.get")
+    def test_not_modified(self, mock_get):
+
+        """Test responses without a cache ttl aren't kept for conditional requests"""
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"ETag": '"abc"'}
+        mock_response.content = json.dumps({"data": {"foo": "bar"}}).encode()
+        mock_get.return_value = mock_response
+
+        self.assertEqual({"foo": "bar"}, self.base.make_request("foo"))
+        self.assertEqual({"foo": "bar"}, self.base.make_request("foo"))
+        self.assertEqual(2, mock_get.call_count)
+        self.assertIsNone(mock_get.call_args[1]["headers"])
+
+    @patch("base.requests.Session.get")
+    def test_revalidate_expired(self, mock_get):
+
+        """Test an expired cached response is revalidated with its ETag"""
+
+        BaseAPI.clear_reference_cache()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"ETag": '"xyz"'}
+        mock_response.content = json.dumps({"data": {"foo": "baz"}}).encode()
+        mock_get.return_value = mock_response
+
+        self.assertEqual({"foo": "baz"}, self.base.make_request("bar", ttl=60))
+        self.assertEqual(1, mock_get.call_count)
+
+        for key, entry in base._memory_cache.items():
+            base._memory_cache[key] = (0,) + entry[1:]
+        mock_response.status_code = 304
+        mock_response.content = b""
+
+        self.assertEqual({"foo": "baz"}, self.base.make_request("bar", ttl=60))
+        self.assertEqual(mock_get.call_args[1]["headers"], {"If-None-Match": '"xyz"'})
+        BaseAPI.clear_reference_cache()
+
+
+
+class TestFixtures(unittest.TestCase):
+
+    """Testing the Fixtures helpers"""
+
+    def setUp(self):
+
+        """Executed before any test"""
+
+        with patch.object(BaseAPI, "meta_info"):
+            self.fixtures = Fixtures(api_key="foo")
+
+    def test_date_range_parallel(self):
+
+        """Test the date range is chunked and fixtures in two chunks are only kept once"""
+
+        def pages(start_date, end_date, **kwargs):
+            # id 0 is returned by every chunk.
+            return iter([[{"id": start_date}, {"id": 0}]])
+
+        with patch.object(Fixtures, "by_date_range_pages", side_effect=pages) as mock_pages:
+            fixtures = self.fixtures.by_date_range_parallel("2021-01-01", "2021-01-10",
+                                                            chunk_days=4)
+
+        self.assertEqual(sorted(call[0] for call in mock_pages.call_args_list),
+                         [("2021-01-01", "2021-01-04"), ("2021-01-05", "2021-01-08"),
+                          ("2021-01-09", "2021-01-10")])
+        self.assertEqual([fixture["id"] for fixture in fixtures],
+                         ["2021-01-01", 0, "2021-01-05", "2021-01-09"])
+
+    def test_date_range_parallel_args(self):
+
+        """Test chunk_days and max_workers must be at least 1"""
+
+        for kwargs in ({"chunk_days": 0}, {"chunk_days": -1}, {"max_workers": 0}):
+            self.assertRaises(ValueError, self.fixtures.by_date_range_parallel,
+                              "2021-01-01", "2021-01-10", **kwargs)
+
+
+    def test_fixture_batching(self):
+
+        """Test fixture calls made together are merged in to one request"""
+
+        self.fixtures._batcher = _FixtureBatcher(self.fixtures, max_delay=0.2)
+        with patch.object(Fixtures, "by_id",
+                          side_effect=lambda ids, **kwargs: [{"id": i} for i in ids]) as mock_by_id:
+            futures = {i: self.fixtures.fixture(i) for i in (3, 1, 2)}
+            missing = self.fixtures.fixture(4, markets=[1])
+            results = {i: future.result(timeout=5) for i, future in futures.items()}
+            self.assertEqual({"id": 4}, missing.result(timeout=5))
+
+        self.assertEqual({i: {"id": i} for i in (3, 1, 2)}, results)
+        # the call with different markets is sent separately.
+        self.assertEqual(2, mock_by_id.call_count)
+        self.assertEqual([3, 1, 2], mock_by_id.call_args_list[0][0][0])
+        self.fixtures.close()
+
+    def test_fixture_batching_error(self):
+
+        """Test an error in a batched request reaches every pending call"""
+
+        self.fixtures._batcher = _FixtureBatcher(self.fixtures, max_delay=0.2)
+        with patch.object(Fixtures, "by_id", side_effect=ServerErrors("boom")):
+            futures = [self.fixtures.fixture(i) for i in (1, 2, 3)]
+            for future in futures:
+                self.assertRaises(ServerErrors, future.result, timeout=5)
+        self.fixtures.close()
+
+    def test_fixture_batcher_close(self):
+
+        """Test closing stops the batching thread after sending pending calls"""
+
+        batcher = self.fixtures._batcher = _FixtureBatcher(self.fixtures, max_delay=0.2)
+        with patch.object(Fixtures, "by_id",
+                          side_effect=lambda ids, **kwargs: [{"id": i} for i in ids]):
+            future = self.fixtures.fixture(1)
+            self.fixtures.close()
+
+        self.assertEqual({"id": 1}, future.result(timeout=5))
+        self.assertFalse(batcher.thread.is_alive())
+        self.assertRaises(RuntimeError, batcher.submit, 2, (None, None, None))
+
+    def test_fixture_batcher_gc(self):
+
+        """Test the batching thread stops once the client is garbage collected"""
+
+        batcher = self.fixtures._batcher = _FixtureBatcher(self.fixtures)
+        del self.fixtures
+        gc.collect()
+        batcher.thread.join(timeout=5)
+
+        self.assertFalse(batcher.thread.is_alive())
+
+
+
+class TestConcurrency(unittest.TestCase):
+
+    """Testing request coalescing and rate limiting"""
+
+    def setUp(self):
+
+        """Executed before any test"""
+
+        with patch.object(BaseAPI, "meta_info"):
+            self.base = BaseAPI(api_key="foo")
+        # pacing is turned off, except in the tests of it.
+        patcher = patch.object(base, "_bucket", base._TokenBucket(0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run_concurrently(self, mock_get, calls: int):
+        """
+        Makes the same request from several threads while the first is held
+        in flight; returns each thread's (result, exception).
+        """
+        started, release = threading.Event(), threading.Event()
+        response = mock_get.return_value
+        mock_get.return_value = None
+
+        def get(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return response
+        mock_get.side_effect = get
+
+        results = [None] * calls
+
+        def call(i):
+            try:
+                results[i] = (self.base.make_request("foo"), None)
+            except BaseException as e:
+                results[i] = (None, e)
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(calls)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+
+        # wait for the other calls to be waiting on the first.
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            flights = list(base._inflight.values())
+            if flights and flights[0][1] == calls - 1:
+                break
+            time.sleep(0.01)
+
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        return results
+
+    @patch("base.requests.Session.get")
+    def test_coalescing(self, mock_get):
+
+        """Test identical requests in flight together share one response"""
+
+        mock_get.return_value = _response({"data": [{"foo": "bar"}]})
+
+        results = self._run_concurrently(mock_get, 4)
+
+        mock_get.assert_called_once()
+        self.assertEqual([([{"foo": "bar"}], None)] * 4, results)
+        # every caller gets its own copy.
+        data = [result for result, _ in results]
+        data[0][0]["foo"] = "baz"
+        self.assertEqual([{"foo": "bar"}], data[1])
+        self.assertEqual(3, len({id(d) for d in data[1:]}))
+        self.assertEqual({}, base._inflight)
+
+    @patch("base.requests.Session.get")
+    def test_coalescing_error(self, mock_get):
+
+        """Test an error in a shared request reaches every caller"""
+
+        mock_get.return_value = _response({"error": {"message": "boom"}}, status_code=500)
+
+        results = self._run_concurrently(mock_get, 3)
+
+        mock_get.assert_called_once()
+        for result, exception in results:
+            self.assertIsNone(result)
+            self.assertIsInstance(exception, ServerErrors)
+        self.assertEqual({}, base._inflight)
+
+    def test_token_bucket(self):
+
+        """Test the bucket allows a burst of rate requests, then paces them"""
+
+        bucket = base._TokenBucket(10)
+        self.assertEqual([0.0] * 10, [bucket.reserve() for _ in range(10)])
+        self.assertAlmostEqual(0.1, bucket.reserve(), places=2)
+
+        bucket.drain()
+        self.assertGreater(bucket.reserve(), 0.1)
+
+        self.assertEqual(0.0, base._TokenBucket(0).reserve())
+
+    def test_set_rate_limit(self):
+
+        """Test the process-wide pacing can be turned on and off"""
+
+        base.set_rate_limit(10)
+        self.assertEqual([0.0] * 10, [base._bucket.reserve() for _ in range(10)])
+        self.assertGreater(base._bucket.reserve(), 0)
+
+        base.set_rate_limit(0)
+        self.assertEqual(0.0, base._bucket.reserve())
+
+    def test_rate_limit_header(self):
+
+        """Test a response with no requests remaining empties the bucket"""
+
+        bucket = base._TokenBucket(10)
+        with patch.object(base, "_bucket", bucket):
+            base._note_rate_limit(Mock(headers={"X-RateLimit-Remaining": "0"}))
+
+        self.assertGreater(bucket.reserve(), 0)
+
+    @patch("base.requests.Session.get")
+    def test_rate_limit_pacing(self, mock_get):
+
+        """Test requests from several threads are paced to the rate limit"""
+
+        mock_get.return_value = _response({"data": {"foo": "bar"}})
+
+        with patch.object(base, "_bucket", base._TokenBucket(20)):
+            start = time.monotonic()
+            threads = [threading.Thread(target=self.base.make_request, args=(f"foo{i}",))
+                       for i in range(30)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+            elapsed = time.monotonic() - start
+
+        self.assertEqual(30, mock_get.call_count)
+        # 20 go straight away, the other 10 at 20 a second.
+        self.assertGreaterEqual(elapsed, 0.45)
+
+    def test_memory_cache_threads(self):
+
+        """Test the response cache stays bounded when filled from several threads"""
+
+        errors = []
+
+        def fill(n):
+            try:
+                for i in range(2000):
+                    base._remember(f"{n}-{i}", b"{}", 60)
+                    if i % 500 == 0:
+                        BaseAPI.clear_reference_cache()
+            except Exception as e:
+                errors.append(e)
+
+        self.addCleanup(BaseAPI.clear_reference_cache)
+        # switch threads as often as possible to bring out any race.
+        self.addCleanup(sys.setswitchinterval, sys.getswitchinterval())
+        sys.setswitchinterval(1e-6)
+        with patch.object(base, "MEMORY_CACHE_SIZE", 16):
+            threads = [threading.Thread(target=fill, args=(n,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(10)
+
+        self.assertEqual([], errors)
+        self.assertLessEqual(len(base._memory_cache), 16)
+
+
+class TestHelpers(unittest.TestCase):
+
+    """Testing the endpoint helpers"""
+
+    def setUp(self):
+
+        """Executed before any test"""
+
+        BaseAPI.clear_reference_cache()
+        self.addCleanup(BaseAPI.clear_reference_cache)
+        patcher = patch.object(base, "_bucket", base._TokenBucket(0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_process_params(self):
+
+        """Test None values are dropped and lists joined"""
+
+        self.assertEqual({}, BaseAPI.process_params({"markets": None, "bookmakers": None}))
+        self.assertEqual({"markets": "1,2", "leagues": "3,4", "stage_ids": 5},
+                         BaseAPI.process_params({"markets": [1, 2], "bookmakers": None,
+                                                 "leagues": (3, 4), "stage_ids": 5}))
+
+    def test_validate_includes(self):
+
+        """Test includes are joined, and unknown includes rejected"""
+
+        self.assertIsNone(_validate_includes(None, TOPSCORERS_INCLUDES))
+        self.assertEqual("goalscorers.player,cardscorers",
+                         _validate_includes("goalscorers.player, cardscorers",
+                                            TOPSCORERS_INCLUDES))
+        self.assertEqual("goalscorers.team",
+                         _validate_includes(["goalscorers.team"], TOPSCORERS_INCLUDES))
+        self.assertEqual("goalscorers.player.country,assistscorers.team",
+                         _validate_includes("goalscorers.player.country,assistscorers.team",
+                                            TOPSCORERS_INCLUDES))
+        self.assertRaises(InvalidIncludes, _validate_includes,
+                          "goalscorers.player,aggregatedGoalscorers", TOPSCORERS_INCLUDES)
+        self.assertRaises(InvalidIncludes, _validate_includes,
+                          "player.goalscorers", TOPSCORERS_INCLUDES)
+
+    @patch("base.requests.Session.get")
+    def test_cache_ttl(self, mock_get):
+
+        """Test classes with a cache_ttl reuse responses, and others don't"""
+
+        mock_get.return_value = _response({"data": [{"id": 1}]})
+
+        self.assertEqual(7 * 24 * 3600, Continents.cache_ttl)
+        self.assertEqual(300, Standings.cache_ttl)
+        self.assertIsNone(Fixtures.cache_ttl)
+
+        with patch.object(BaseAPI, "meta_info"):
+            continents, fixtures = Continents(api_key="foo"), Fixtures(api_key="foo")
+
+        for _ in range(2):
+            self.assertEqual([{"id": 1}], continents.continents())
+        self.assertEqual(1, mock_get.call_count)
+
+        continents.make_request("continents", no_cache=True)
+        self.assertEqual(2, mock_get.call_count)
+
+        for _ in range(2):
+            fixtures.by_id(1)
+        self.assertEqual(4, mock_get.call_count)
+
+    @patch("base.requests.Session.get")
+    def test_odds_many_cache(self, mock_get):
+
+        """Test odds_many shares the client's settings and response cache"""
+
+        mock_get.return_value = _response({"data": [{"id": 1}]})
+        with patch.object(BaseAPI, "meta_info"):
+            odds = Odds(api_key="foo")
+        odds.odds(1)
+
+        async_get = AsyncMock(return_value=(200, {"data": [{"id": 2}]}))
+        with patch.object(base, "aiohttp", Mock()), \
+                patch.object(BaseAPI, "meta_info") as mock_meta_info, \
+                patch.object(AsyncSportMonks, "_get", async_get):
+            self.assertEqual([[{"id": 1}], [{"id": 2}]], odds.odds_many([1, 2]))
+            self.assertEqual([[{"id": 1}], [{"id": 2}]], odds.odds_many([1, 2]))
+            sm = odds._async
+
+        mock_meta_info.assert_not_called()
+        # fixture 1 came from the sync call, and fixture 2 from the first odds_many.
+        self.assertEqual(1, async_get.await_count)
+        self.assertEqual((odds.initial_params, 60), (sm.initial_params, sm.cache_ttl))
+
+    def test_odds_many_running_loop(self):
+
+        """Test odds_many raises a clear error from inside an event loop"""
+
+        with patch.object(BaseAPI, "meta_info"):
+            odds = Odds(api_key="foo")
+
+        async def call():
+            odds.odds_many([1])
+
+        with self.assertRaisesRegex(RuntimeError, "AsyncSportMonks.odds_many"):
+            asyncio.run(call())
+
 
 if __name__ == "__main__":
     unittest.main()